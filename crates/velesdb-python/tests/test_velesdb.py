@@ -4,10 +4,12 @@ Tests for VelesDB Python bindings.
 Run with: pytest tests/test_velesdb.py -v
 """
 
+import atexit
 import pytest
 import tempfile
 import shutil
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Import will fail until the module is built with maturin
 # These tests are designed to run after: maturin develop
@@ -17,13 +19,19 @@ except ImportError:
     pytest.skip("velesdb module not built yet - run 'maturin develop' first", allow_module_level=True)
 
 
+# Directories are removed in the background so the next test does not wait
+# on unlinking segment files; shutdown at exit waits for the last ones.
+_cleanup_pool = ThreadPoolExecutor(max_workers=2)
+atexit.register(_cleanup_pool.shutdown, wait=True)
+
+
 @pytest.fixture
 def temp_db_path():
     """Create a temporary directory for database tests."""
     path = tempfile.mkdtemp(prefix="velesdb_test_")
     yield path
     # Cleanup after test
-    shutil.rmtree(path, ignore_errors=True)
+    _cleanup_pool.submit(shutil.rmtree, path, ignore_errors=True)
 
 
 class TestDatabase:
@@ -18,17 +18,18 @@ Example:
     >>> nodes = retriever.retrieve("What is machine learning?")
 """
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
+import asyncio
+import itertools
 import logging
-import requests
+import threading
+import httpx
+import numpy as np
 
-from llamaindex_velesdb.security import (
-    validate_url,
-    validate_k,
-    validate_timeout,
-    SecurityError,
-)
+from llamaindex_velesdb.security import validate_retriever_args
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,36 @@ except ImportError:
     from llama_index.retrievers import BaseRetriever
     from llama_index.schema import NodeWithScore, QueryBundle, TextNode
 
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    # Standard library fallback producing the same bytes-in/bytes-out API
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on concurrent connections to the VelesDB server per retriever
+MAX_GRAPH_CONNECTIONS = 32
+# Number of distinct sources that triggers an early dispatch
+MAX_DISPATCH_BATCH_SIZE = 128
+# Metadata keys probed (in order) for a numeric node ID
+_NODE_ID_KEYS = ("id", "doc_id", "node_id")
+# Metadata stamped on results in low latency (vector-only) mode
+_LOW_LATENCY_METADATA = {"graph_depth": 0, "retrieval_mode": "vector_only"}
+
 
 @dataclass
 class TraversalResult:
@@ -49,6 +80,116 @@ class TraversalResult:
     path: List[int] = field(default_factory=list)
 
 
+class _BatchDispatcher:
+    """Collects concurrent graph traversals and dispatches them together.
+    
+    Traversal requests submitted within ``dispatch_timeout_ms`` of each
+    other are grouped into one batch. Each distinct source node is
+    traversed once per batch and its result is scattered to every waiting
+    caller, so concurrent queries that share seed nodes share the server
+    round-trip.
+    
+    Args:
+        fetch: Coroutine function performing a single traversal.
+        dispatch_timeout_ms: Collection window in milliseconds.
+        max_batch_size: Distinct traversals that trigger an early dispatch.
+        conservative_dispatch: If True, always wait for the full window.
+    """
+    
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[np.ndarray]],
+        dispatch_timeout_ms: float = 0.0,
+        max_batch_size: int = MAX_DISPATCH_BATCH_SIZE,
+        conservative_dispatch: bool = False,
+    ):
+        self.loop = asyncio.get_running_loop()
+        self._fetch = fetch
+        self._window_sec = dispatch_timeout_ms / 1000.0
+        self._max_batch_size = max_batch_size
+        self._conservative = conservative_dispatch
+        self._pending: Dict[int, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop keeps only weak references to tasks, so hold running batches
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, source_id: int) -> np.ndarray:
+        """Queue a traversal and wait for its batch to complete."""
+        future = self.loop.create_future()
+        self._pending.setdefault(source_id, []).append(future)
+        
+        if not self._conservative and len(self._pending) >= self._max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = self.loop.call_later(self._window_sec, self._dispatch)
+        
+        return await future
+    
+    def _dispatch(self) -> None:
+        """Send all pending traversals as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = self.loop.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def aclose(self) -> None:
+        """Dispatch any queued traversals and wait for running batches."""
+        self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def _run_batch(
+        self, batch: Dict[int, List[asyncio.Future]]
+    ) -> None:
+        """Run each distinct traversal and resolve its waiters."""
+        keys = list(batch)
+        outcomes = await asyncio.gather(
+            *[self._fetch(source_id) for source_id in keys],
+            return_exceptions=True,
+        )
+        for key, outcome in zip(keys, outcomes):
+            for future in batch[key]:
+                if future.done():
+                    continue  # Caller was cancelled
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+
+def _make_id_accessor(sample: Any) -> Callable[[Any], Optional[int]]:
+    """Build a node ID accessor specialized for the class of ``sample``.
+    
+    Metadata keys vary per node, so they are still probed on every call;
+    only the class-level attribute checks are resolved up front.
+    """
+    has_metadata = hasattr(sample, "metadata")
+    has_node_id = hasattr(sample, "node_id")
+    
+    def accessor(node: Any) -> Optional[int]:
+        # Try metadata first
+        if has_metadata:
+            metadata = node.metadata
+            for key in _NODE_ID_KEYS:
+                if key in metadata:
+                    val = metadata[key]
+                    return int(val) if isinstance(val, (int, str)) else None
+        
+        # Try node_id attribute
+        if has_node_id:
+            try:
+                return int(node.node_id)
+            except (ValueError, TypeError):
+                pass
+        return None
+    
+    return accessor
+
+
 class GraphRetriever(BaseRetriever):
     """Retriever that uses graph traversal for context expansion.
     
@@ -67,6 +208,10 @@ class GraphRetriever(BaseRetriever):
         low_latency: If True, skip graph expansion for minimal latency (default: False)
         timeout_ms: Timeout for graph operations in milliseconds (default: 1000)
         fallback_on_timeout: If True, return vector-only results on timeout (default: True)
+        dispatch_timeout_ms: Window for batching concurrent traversals, in
+            milliseconds (default: 0, i.e. batch within one event loop tick)
+        conservative_dispatch: If True, always wait the full dispatch window
+            instead of dispatching early once a batch is full (default: False)
         
     Example:
         >>> # Full graph expansion mode
@@ -104,14 +249,16 @@ class GraphRetriever(BaseRetriever):
         low_latency: bool = False,
         timeout_ms: int = 1000,
         fallback_on_timeout: bool = True,
+        dispatch_timeout_ms: int = 0,
+        conservative_dispatch: bool = False,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
         
         # Security: Validate inputs
-        validate_url(server_url)
-        validate_k(seed_k, "seed_k")
-        validate_k(expand_k, "expand_k")
+        validate_retriever_args(
+            server_url, seed_k, expand_k, timeout_ms, dispatch_timeout_ms
+        )
         
         self._index = index
         self._server_url = server_url
@@ -123,6 +270,15 @@ class GraphRetriever(BaseRetriever):
         self._low_latency = low_latency
         self._timeout_ms = timeout_ms
         self._fallback_on_timeout = fallback_on_timeout
+        self._dispatch_timeout_ms = dispatch_timeout_ms
+        self._conservative_dispatch = conservative_dispatch
+        self._client: Optional[httpx.Client] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._client_lock = threading.Lock()
+        # Per event loop: [client, number of users currently holding it]
+        self._aclients: Dict[asyncio.AbstractEventLoop, List[Any]] = {}
+        self._dispatcher: Optional[_BatchDispatcher] = None
+        self._id_accessor_cache: Dict[type, Callable[[Any], Optional[int]]] = {}
     
     def _infer_collection_name(self) -> str:
         """Try to infer collection name from index's vector store."""
@@ -136,63 +292,234 @@ class GraphRetriever(BaseRetriever):
             pass
         return "default"
     
+    def _client_options(self) -> Dict[str, Any]:
+        """Connection settings shared by the sync and async HTTP clients."""
+        return {
+            "http2": _HTTP2_AVAILABLE,
+            "timeout": self._timeout_ms / 1000.0,
+            "limits": httpx.Limits(max_connections=MAX_GRAPH_CONNECTIONS),
+        }
+    
+    def _get_client(self) -> httpx.Client:
+        """Return the pooled HTTP client used by synchronous retrieval.
+        
+        The client is created on first use, shared across calls and
+        threads, and released by :meth:`close`.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(**self._client_options())
+        return self._client
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool running synchronous traversals.
+        
+        Like the pooled client, it is created on first use and released
+        by :meth:`close`, so worker threads are not restarted per call.
+        """
+        if self._executor is None:
+            with self._client_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=MAX_GRAPH_CONNECTIONS,
+                        thread_name_prefix="velesdb-graph",
+                    )
+        return self._executor
+    
+    @asynccontextmanager
+    async def _async_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold the HTTP client shared by async requests on the running loop.
+        
+        Requests overlapping on one loop share a pooled connection set (and
+        multiplex over HTTP/2 when the ``h2`` package is installed). The
+        client is closed as soon as its last holder exits, on the loop that
+        created it, so no client outlives the event loop it is bound to.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._aclients.get(loop)
+        if entry is None:
+            entry = self._aclients[loop] = [httpx.AsyncClient(**self._client_options()), 0]
+        entry[1] += 1
+        try:
+            yield entry[0]
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                if self._aclients.get(loop) is entry:
+                    del self._aclients[loop]
+                await entry[0].aclose()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP client and thread pool used by synchronous retrieval.
+        
+        Async retrieval closes its clients itself once no request is in
+        flight. The retriever stays usable; a new client and pool are
+        created on the next synchronous call.
+        """
+        with self._client_lock:
+            client, self._client = self._client, None
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        if client is not None:
+            client.close()
+    
+    async def aclose(self) -> None:
+        """Async counterpart of :meth:`close`.
+        
+        Also waits for traversal batches still pending on the running loop
+        and closes every async client still held, each on its own loop.
+        """
+        loop = asyncio.get_running_loop()
+        dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None and dispatcher.loop is loop:
+            await dispatcher.aclose()
+        
+        aclients, self._aclients = self._aclients, {}
+        for client_loop, (client, _) in aclients.items():
+            if client_loop is loop:
+                await client.aclose()
+            elif client_loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+                )
+        self.close()
+    
+    def _get_dispatcher(self) -> _BatchDispatcher:
+        """Return the traversal dispatcher bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is None or self._dispatcher.loop is not loop:
+            self._dispatcher = _BatchDispatcher(
+                self._post_traversal,
+                dispatch_timeout_ms=self._dispatch_timeout_ms,
+                conservative_dispatch=self._conservative_dispatch,
+            )
+        return self._dispatcher
+    
+    def _seed_retriever(self) -> Any:
+        """Return the index retriever used for the seed vector search."""
+        k = self._seed_k if self._low_latency else self._expand_k
+        return self._index.as_retriever(similarity_top_k=k)
+    
+    def _vector_only(self, seed_nodes: List[NodeWithScore]) -> List[NodeWithScore]:
+        """Return seed nodes without graph expansion (low latency mode)."""
+        out = list(itertools.islice(seed_nodes, self._expand_k))
+        for node_with_score in out:
+            node_with_score.node.metadata.update(_LOW_LATENCY_METADATA)
+        return out
+    
+    def _map_seeds(self, seed_nodes: List[NodeWithScore]) -> Dict[int, NodeWithScore]:
+        """Map the numeric ID of each seed node to the seed."""
+        seed_map = {}
+        for node_with_score in seed_nodes:
+            node_id = self._extract_node_id(node_with_score.node)
+            if node_id is not None:
+                seed_map[node_id] = node_with_score
+        return seed_map
+    
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """Retrieve nodes using vector search + graph expansion.
         
+        Graph traversals for all seed nodes run concurrently on a thread
+        pool over one pooled HTTP client, both kept across calls until
+        :meth:`close`.
+        
         Args:
             query_bundle: Query bundle with query string
             
         Returns:
             List of NodeWithScore objects
         """
-        query_str = query_bundle.query_str
-        
         # Step 1: Vector search for seed nodes
-        k = self._seed_k if self._low_latency else self._expand_k
-        base_retriever = self._index.as_retriever(similarity_top_k=k)
-        seed_nodes = base_retriever.retrieve(query_str)
-        
-        if not seed_nodes:
-            return []
+        seed_nodes = self._seed_retriever().retrieve(query_bundle.query_str)
         
         # LOW LATENCY MODE: Skip graph expansion entirely
-        if self._low_latency:
-            for node_with_score in seed_nodes[:self._expand_k]:
-                node_with_score.node.metadata["graph_depth"] = 0
-                node_with_score.node.metadata["retrieval_mode"] = "vector_only"
-            return seed_nodes[:self._expand_k]
+        if not seed_nodes or self._low_latency:
+            return self._vector_only(seed_nodes)
         
         # Step 2: Graph traversal for context expansion
-        expanded_ids = set()
-        seed_map = {}
-        graph_available = True
+        seed_map = self._map_seeds(seed_nodes)
+        source_ids = list(seed_map)
         
-        for node_with_score in seed_nodes:
-            node = node_with_score.node
-            node_id = self._extract_node_id(node)
+        def traverse(source_id: int) -> Union[np.ndarray, Exception]:
+            try:
+                return self._post_traversal_sync(source_id)
+            except Exception as e:
+                return e
+        
+        if len(source_ids) > 1:
+            traversals = list(self._get_executor().map(traverse, source_ids))
+        else:
+            traversals = [traverse(source_id) for source_id in source_ids]
+        
+        # Step 3: Build result list
+        return self._expand(seed_map, source_ids, traversals)
+    
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """Retrieve nodes using vector search + graph expansion.
+        
+        Graph traversals for all seed nodes are issued concurrently over
+        a shared connection pool instead of one request after another.
+        
+        Args:
+            query_bundle: Query bundle with query string
             
-            if node_id is not None:
-                seed_map[node_id] = node_with_score
-                expanded_ids.add(node_id)
-                
-                # Traverse graph from this seed (with timeout)
-                if graph_available:
-                    try:
-                        neighbors = self._traverse_graph(node_id)
-                        for neighbor_id in neighbors:
-                            expanded_ids.add(neighbor_id)
-                    except requests.exceptions.Timeout:
-                        # Timeout: disable graph for remaining seeds
-                        logger.warning(f"Graph traversal timeout for node {node_id}, falling back to vector-only")
-                        if self._fallback_on_timeout:
-                            graph_available = False
-                        else:
-                            raise
-                    except Exception as e:
-                        # Graph traversal is optional - continue without it
-                        logger.debug(f"Graph traversal failed for node {node_id}: {e}")
+        Returns:
+            List of NodeWithScore objects
+        """
+        # Step 1: Vector search for seed nodes
+        seed_nodes = await self._seed_retriever().aretrieve(query_bundle.query_str)
+        
+        # LOW LATENCY MODE: Skip graph expansion entirely
+        if not seed_nodes or self._low_latency:
+            return self._vector_only(seed_nodes)
+        
+        # Step 2: Traverse graph from all seeds concurrently (with timeout)
+        seed_map = self._map_seeds(seed_nodes)
+        source_ids = list(seed_map)
+        async with self._async_client():
+            traversals = await asyncio.gather(
+                *[self._traverse_graph(node_id) for node_id in source_ids],
+                return_exceptions=True,
+            )
         
         # Step 3: Build result list
+        return self._expand(seed_map, source_ids, traversals)
+    
+    def _expand(
+        self,
+        seed_map: Dict[int, NodeWithScore],
+        source_ids: List[int],
+        traversals: List[Any],
+    ) -> List[NodeWithScore]:
+        """Combine seeds with the neighbors found by their traversals.
+        
+        Args:
+            seed_map: Seed nodes keyed by numeric node ID
+            source_ids: Traversed seed IDs, aligned with ``traversals``
+            traversals: Neighbor ID array or raised exception per seed
+            
+        Returns:
+            Seeds followed by expanded neighbors, at most ``expand_k``
+        """
+        neighbor_id_set = set()
+        graph_available = True
+        
+        for node_id, neighbors in zip(source_ids, traversals):
+            if isinstance(neighbors, httpx.TimeoutException):
+                # Timeout: disable graph expansion for this query
+                logger.warning(f"Graph traversal timeout for node {node_id}, falling back to vector-only")
+                if self._fallback_on_timeout:
+                    graph_available = False
+                else:
+                    raise neighbors
+            elif isinstance(neighbors, BaseException):
+                # Graph traversal is optional - continue without it
+                logger.debug(f"Graph traversal failed for node {node_id}: {neighbors}")
+            else:
+                neighbor_id_set.update(neighbors.tolist())
+        
         results = []
         
         # Add seed nodes first (highest relevance)
@@ -203,11 +530,11 @@ class GraphRetriever(BaseRetriever):
         
         # Fetch neighbor nodes (only if graph was used)
         if graph_available:
-            remaining_slots = self._expand_k - len(results)
-            neighbor_ids = [
-                nid for nid in expanded_ids 
-                if nid not in seed_map
-            ][:remaining_slots]
+            remaining_slots = max(self._expand_k - len(results), 0)
+            # Traversals are shared across queries, so drop this query's seeds here
+            neighbor_ids = list(itertools.islice(
+                neighbor_id_set - seed_map.keys(), remaining_slots
+            ))
             
             for neighbor_id in neighbor_ids:
                 try:
@@ -225,37 +552,39 @@ class GraphRetriever(BaseRetriever):
         return results[:self._expand_k]
     
     def _extract_node_id(self, node: Any) -> Optional[int]:
-        """Extract numeric node ID from a LlamaIndex node."""
+        """Extract numeric node ID from a LlamaIndex node.
+        
+        The attribute probing is resolved once per node class and cached as
+        an accessor, so repeated calls skip the ``hasattr`` checks.
+        """
+        node_type = type(node)
+        accessor = self._id_accessor_cache.get(node_type)
+        if accessor is None:
+            accessor = _make_id_accessor(node)
+            self._id_accessor_cache[node_type] = accessor
         try:
-            # Try metadata first
-            if hasattr(node, "metadata"):
-                for key in ["id", "doc_id", "node_id"]:
-                    if key in node.metadata:
-                        val = node.metadata[key]
-                        return int(val) if isinstance(val, (int, str)) else None
-            
-            # Try node_id attribute
-            if hasattr(node, "node_id"):
-                try:
-                    return int(node.node_id)
-                except (ValueError, TypeError):
-                    pass
+            return accessor(node)
         except Exception:
-            pass
-        return None
+            return None
     
-    def _traverse_graph(self, source_id: int) -> List[int]:
+    async def _traverse_graph(self, source_id: int) -> np.ndarray:
         """Traverse graph from source node.
         
+        Concurrent traversals are batched by the retriever's dispatcher.
+        
         Args:
             source_id: Starting node ID
             
         Returns:
-            List of neighbor node IDs
+            Array of neighbor node IDs (uint64)
             
         Raises:
-            requests.exceptions.Timeout: If request exceeds timeout_ms
+            httpx.TimeoutException: If request exceeds timeout_ms
         """
+        return await self._get_dispatcher().submit(source_id)
+    
+    def _traversal_request(self, source_id: int) -> Tuple[str, bytes]:
+        """Build the URL and JSON body of a traversal request."""
         url = f"{self._server_url}/collections/{self._collection_name}/graph/traverse"
         
         payload = {
@@ -265,17 +594,39 @@ class GraphRetriever(BaseRetriever):
             "limit": self._expand_k * 2,
             "rel_types": self._rel_types,
         }
-        
-        # Convert timeout_ms to seconds for requests
-        timeout_sec = self._timeout_ms / 1000.0
-        
-        response = requests.post(url, json=payload, timeout=timeout_sec)
-        
+        return url, _json_dumps(payload)
+    
+    @staticmethod
+    def _traversal_targets(response: httpx.Response) -> np.ndarray:
+        """Extract neighbor node IDs (uint64) from a traversal response."""
         if response.status_code == 200:
-            data = response.json()
-            return [r["target_id"] for r in data.get("results", [])]
+            data = _json_loads(response.content)
+            results = data.get("results", ())
+            return np.fromiter(
+                (r["target_id"] for r in results), dtype=np.uint64, count=len(results)
+            )
         
-        return []
+        return np.empty(0, dtype=np.uint64)
+    
+    async def _post_traversal(self, source_id: int) -> np.ndarray:
+        """Send a single traversal request to the VelesDB server.
+        
+        Args:
+            source_id: Starting node ID
+            
+        Returns:
+            Array of neighbor node IDs (uint64)
+        """
+        url, content = self._traversal_request(source_id)
+        async with self._async_client() as client:
+            response = await client.post(url, content=content, headers=_JSON_HEADERS)
+        return self._traversal_targets(response)
+    
+    def _post_traversal_sync(self, source_id: int) -> np.ndarray:
+        """Blocking counterpart of :meth:`_post_traversal`."""
+        url, content = self._traversal_request(source_id)
+        response = self._get_client().post(url, content=content, headers=_JSON_HEADERS)
+        return self._traversal_targets(response)
     
     def _fetch_node(self, node_id: int) -> Optional[TextNode]:
         """Fetch a node by ID from the vector store.
@@ -317,8 +668,14 @@ class GraphQARetriever(GraphRetriever):
     
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """Retrieve with re-ranking."""
-        nodes = super()._retrieve(query_bundle)
-        
+        return self._rerank(super()._retrieve(query_bundle))
+    
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """Retrieve with re-ranking."""
+        return self._rerank(await super()._aretrieve(query_bundle))
+    
+    def _rerank(self, nodes: List[NodeWithScore]) -> List[NodeWithScore]:
+        """Order nodes by graph depth, then by score."""
         if self._rerank_by_depth:
             # Sort by graph depth, then by score
             nodes.sort(key=lambda n: (
@@ -18,6 +18,9 @@ MAX_PATH_LENGTH = 4096  # Max path length
 ALLOWED_METRICS = {"cosine", "euclidean", "dot", "hamming", "jaccard"}
 DEFAULT_TIMEOUT_MS = 30_000  # 30 seconds max timeout
 
+# Translation table deleting characters that enable header/URL injection
+_URL_FORBIDDEN = str.maketrans("", "", "\n\r\x00")
+
 
 class SecurityError(ValueError):
     """Raised when a security validation fails."""
@@ -44,6 +47,10 @@ def validate_path(path: str) -> str:
     if len(path) > MAX_PATH_LENGTH:
         raise SecurityError(f"Path exceeds maximum length of {MAX_PATH_LENGTH}")
     
+    # Check for null bytes (path injection) before doing any normalization work
+    if "\x00" in path:
+        raise SecurityError("Path contains null bytes")
+    
     # Normalize the path
     try:
         normalized = os.path.normpath(path)
@@ -51,10 +58,6 @@ def validate_path(path: str) -> str:
     except (ValueError, OSError) as e:
         raise SecurityError(f"Invalid path: {e}")
     
-    # Check for null bytes (path injection)
-    if "\x00" in path:
-        raise SecurityError("Path contains null bytes")
-    
     # Check for suspicious patterns
     suspicious_patterns = [
         r"\.\.[/\\]",  # Parent directory traversal
@@ -261,8 +264,8 @@ def validate_url(url: str) -> str:
     if not url.startswith(("http://", "https://")):
         raise SecurityError("URL must start with http:// or https://")
     
-    # Check for common injection patterns
-    if any(c in url for c in ["\n", "\r", "\x00"]):
+    # Check for common injection patterns (single C-level pass over the URL)
+    if len(url.translate(_URL_FORBIDDEN)) != len(url):
         raise SecurityError("URL contains invalid characters")
     
     return url
@@ -312,3 +315,39 @@ def validate_timeout(timeout_ms: int) -> int:
         raise SecurityError(f"Timeout exceeds maximum of {DEFAULT_TIMEOUT_MS}ms (30s)")
     
     return timeout_ms
+
+
+def validate_retriever_args(
+    server_url: str,
+    seed_k: int,
+    expand_k: int,
+    timeout_ms: int,
+    dispatch_timeout_ms: int,
+) -> None:
+    """Validate GraphRetriever constructor arguments.
+    
+    Args:
+        server_url: VelesDB server URL.
+        seed_k: Number of seed nodes from vector search.
+        expand_k: Maximum number of nodes returned.
+        timeout_ms: Graph traversal timeout in milliseconds.
+        dispatch_timeout_ms: Traversal batching window in milliseconds.
+        
+    Raises:
+        SecurityError: On the first argument that fails validation.
+    """
+    validate_url(server_url)
+    validate_k(seed_k, "seed_k")
+    validate_k(expand_k, "expand_k")
+    validate_timeout(timeout_ms)
+    
+    if not isinstance(dispatch_timeout_ms, int) or isinstance(dispatch_timeout_ms, bool):
+        raise SecurityError(
+            f"dispatch_timeout_ms must be an integer, got {type(dispatch_timeout_ms).__name__}"
+        )
+    if dispatch_timeout_ms < 0:
+        raise SecurityError("dispatch_timeout_ms must not be negative")
+    if dispatch_timeout_ms > DEFAULT_TIMEOUT_MS:
+        raise SecurityError(
+            f"dispatch_timeout_ms exceeds maximum of {DEFAULT_TIMEOUT_MS}ms (30s)"
+        )
@@ -6,10 +6,19 @@ as the underlying vector database for storing and retrieving embeddings.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
-from typing import Any, List, Optional
-
-from llama_index.core.schema import BaseNode, TextNode
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from llama_index.core.schema import BaseNode, MetadataMode, TextNode
 from llama_index.core.vector_stores.types import (
     BasePydanticVectorStore,
     VectorStoreQuery,
@@ -34,6 +43,32 @@ from llamaindex_velesdb.security import (
     SecurityError,
 )
 
+try:
+    import xxhash
+
+    _XXHASH_AVAILABLE = True
+except ImportError:
+    _XXHASH_AVAILABLE = False
+
+
+# Nodes converted and upserted per chunk in add_bulk
+DEFAULT_BULK_CHUNK_SIZE = 2048
+
+# Seconds get_collection_info() reuses the last native info() result
+INFO_CACHE_TTL = 1.0
+
+# Batch results hydrated on a thread pool (free-threaded interpreters only)
+PARALLEL_HYDRATE_MIN_BATCH = 8
+_MAX_HYDRATE_WORKERS = 4
+
+# Separators of the engine's BM25 tokenizer for lowercased ASCII text
+_BM25_SPLIT = re.compile(r"[^a-z0-9]+")
+
+# Metadata value types stored as payload fields; the frozenset gives an
+# exact-type fast path, the tuple catches subclasses (e.g. IntEnum)
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+_SCALAR_TUPLE = (str, int, float, bool)
+
 
 def _stable_hash_id(value: str) -> int:
     """Generate a stable numeric ID from a string using SHA256.
@@ -56,6 +91,265 @@ def _stable_hash_id(value: str) -> int:
     return int.from_bytes(hash_bytes[:8], byteorder="big") & 0x7FFFFFFFFFFFFFFF
 
 
+def _xxh3_hash_id(value: str) -> int:
+    """Generate a stable numeric ID from a string using XXH3-64.
+    
+    Deterministic across processes like :func:`_stable_hash_id`, but
+    several times faster. IDs differ from the SHA256 scheme, so a
+    collection must always be accessed with the same ``id_hash``.
+    
+    Args:
+        value: String to hash.
+        
+    Returns:
+        Positive 63-bit integer ID compatible with VelesDB Core.
+    """
+    return xxhash.xxh3_64_intdigest(value.encode("utf-8")) & 0x7FFFFFFFFFFFFFFF
+
+
+def _get_id_hasher(id_hash: str) -> Callable[[str], int]:
+    """Return the node-ID hash function for an ``id_hash`` setting.
+    
+    Raises:
+        ValueError: If the scheme is unknown.
+        ImportError: If ``"xxh3"`` is requested without xxhash installed.
+    """
+    if id_hash == "sha256":
+        return _stable_hash_id
+    if id_hash == "xxh3":
+        if not _XXHASH_AVAILABLE:
+            raise ImportError(
+                "xxhash package required for id_hash='xxh3': "
+                "pip install llama-index-vector-stores-velesdb[xxhash]"
+            )
+        return _xxh3_hash_id
+    raise ValueError(f"Unknown id_hash '{id_hash}'. Use 'sha256' or 'xxh3'.")
+
+
+def _to_f32(vector: Any) -> np.ndarray:
+    """Return a vector as a contiguous float32 array.
+    
+    NumPy hands the buffer to the native binding in one copy instead of
+    unboxing one Python float per component. Arrays that already are
+    contiguous float32 are returned as-is.
+    
+    Args:
+        vector: Embedding as a list of floats or a NumPy array.
+        
+    Returns:
+        Contiguous float32 NumPy array.
+    """
+    return np.ascontiguousarray(vector, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=256)
+def _bm25_terms(query_str: str) -> Optional[Tuple[str, ...]]:
+    """Tokenize a text query the way the engine's BM25 index does.
+    
+    Mirrors the native tokenizer (lowercase, split on non-alphanumerics,
+    drop one-character tokens) for ASCII input only, where the match is
+    exact. Queries with equal terms get equal BM25 results, so the terms
+    serve as the query cache key.
+    
+    Returns:
+        Tuple of query terms, or None for non-ASCII queries.
+    """
+    if not query_str.isascii():
+        return None
+    return tuple(term for term in _BM25_SPLIT.split(query_str.lower()) if len(term) > 1)
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale a float32 vector, or each row of a matrix, to unit length.
+    
+    Returns a new array; zero vectors are left as they are. Norms come from
+    a row-wise dot product, which skips ``np.linalg.norm``'s generic dispatch.
+    """
+    norms = np.sqrt(np.einsum("...i,...i->...", vectors, vectors))[..., None]
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _node_payload(node: BaseNode, node_id: str) -> dict:
+    """Build the VelesDB payload for a node.
+    
+    The payload holds the node text, its LlamaIndex ID and every scalar
+    metadata value (other types cannot be stored as payload fields). The
+    text is taken without metadata, which is already stored as fields.
+    """
+    payload = {"text": node.get_content(metadata_mode=MetadataMode.NONE), "node_id": node_id}
+    metadata = getattr(node, "metadata", None)
+    if metadata:
+        payload.update(
+            (key, value) for key, value in metadata.items()
+            if type(value) in _SCALAR_TYPES or isinstance(value, _SCALAR_TUPLE)
+        )
+    return payload
+
+
+def _nodes_to_columns(
+    nodes: Sequence[BaseNode],
+    id_fn: Callable[[str], int] = _stable_hash_id,
+    normalize: bool = False,
+) -> Tuple[np.ndarray, np.ndarray, List[dict], List[str]]:
+    """Convert nodes into column arrays (structure-of-arrays).
+    
+    Nodes without an embedding are skipped.
+    
+    Args:
+        nodes: Nodes to convert.
+        id_fn: Function mapping a node ID to its numeric point ID.
+        normalize: Scale every embedding to unit length.
+    
+    Returns:
+        Tuple of (uint64 point IDs, float32 (N, d) vectors, payloads,
+        node IDs of the converted nodes).
+    """
+    node_ids: List[str] = []
+    embeddings: List[np.ndarray] = []
+    payloads: List[dict] = []
+    for node in nodes:
+        # Read the field directly: get_embedding() raises on None
+        embedding = node.embedding
+        if embedding is None:
+            continue
+        node_id = node.node_id
+        node_ids.append(node_id)
+        embeddings.append(_to_f32(embedding))
+        payloads.append(_node_payload(node, node_id))
+    if not node_ids:
+        return np.empty(0, dtype=np.uint64), np.empty((0, 0), dtype=np.float32), [], []
+    ids = np.fromiter((id_fn(nid) for nid in node_ids), dtype=np.uint64, count=len(node_ids))
+    vectors = np.stack(embeddings)
+    if normalize:
+        vectors = _l2_normalize(vectors)
+    return ids, vectors, payloads, node_ids
+
+
+def _nodes_to_points(
+    nodes: Sequence[BaseNode],
+    id_fn: Callable[[str], int] = _stable_hash_id,
+    normalize: bool = False,
+) -> Tuple[List[dict], List[str]]:
+    """Convert nodes into VelesDB point dicts.
+    
+    Nodes without an embedding are skipped. Embeddings are stacked into
+    one float32 block and each point references a row view of it.
+    
+    Args:
+        nodes: Nodes to convert.
+        id_fn: Function mapping a node ID to its numeric point ID.
+        normalize: Scale every embedding to unit length.
+    
+    Returns:
+        Tuple of (points, node IDs of the converted nodes).
+    """
+    ids, vectors, payloads, node_ids = _nodes_to_columns(nodes, id_fn, normalize)
+    points = [
+        {"id": point_id, "vector": vector, "payload": payload}
+        for point_id, vector, payload in zip(ids.tolist(), vectors, payloads)
+    ]
+    return points, node_ids
+
+
+def _filter_by_score(results: List[dict], score_threshold: Optional[float]) -> List[dict]:
+    """Drop native rows scoring below ``score_threshold`` (None keeps all)."""
+    if score_threshold is None:
+        return results
+    return [r for r in results if r.get("score", 0.0) >= score_threshold]
+
+
+def _gil_enabled() -> bool:
+    """Return whether the GIL is active (always True before Python 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def _hydrate_results(results: Sequence[dict]) -> VectorStoreQueryResult:
+    """Turn native search rows into a query result.
+    
+    The binding builds a fresh payload dict for every row, so ``text`` and
+    ``node_id`` are popped in place and the remainder is used directly as
+    the node metadata.
+    """
+    nodes: List[TextNode] = []
+    similarities: List[float] = []
+    ids: List[str] = []
+    for result in results:
+        payload = result.get("payload") or {}
+        text = payload.pop("text", "")
+        node_id = payload.pop("node_id", None) or str(result.get("id", ""))
+        nodes.append(TextNode(text=text, id_=node_id, metadata=payload))
+        similarities.append(result.get("score", 0.0))
+        ids.append(node_id)
+    return VectorStoreQueryResult(nodes=nodes, similarities=similarities, ids=ids)
+
+
+def _copy_result(result: VectorStoreQueryResult) -> VectorStoreQueryResult:
+    """Copy a query result so callers can edit nodes and metadata in place."""
+    nodes = [
+        node.model_copy(update={"metadata": dict(node.metadata)})
+        for node in result.nodes or ()
+    ]
+    return VectorStoreQueryResult(
+        nodes=nodes, similarities=list(result.similarities or ()), ids=list(result.ids or ())
+    )
+
+
+class _ResultCache:
+    """Bounded LRU cache with per-entry time-to-live.
+    
+    Args:
+        maxsize: Maximum number of entries kept.
+        ttl: Seconds after which an entry expires.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # The async store methods run on worker threads
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for ``key`` or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recent entry."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries (hit/miss counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> dict:
+        """Return size and hit-rate counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
 class VelesDBVectorStore(BasePydanticVectorStore):
     """VelesDB vector store for LlamaIndex.
 
@@ -84,6 +378,10 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         collection_name: Name of the collection to use.
         metric: Distance metric (cosine, euclidean, dot).
         storage_mode: Vector storage mode (full, sq8, binary).
+        id_hash: Node-ID hash scheme (sha256, xxh3).
+        normalize_embeddings: Store and query unit-length vectors (cosine only).
+        query_cache_size: Max cached query results (0 disables the cache).
+        query_cache_ttl: Seconds a cached query result stays valid.
     """
 
     stores_text: bool = True
@@ -93,10 +391,19 @@ class VelesDBVectorStore(BasePydanticVectorStore):
     collection_name: str = "llamaindex"
     metric: str = "cosine"
     storage_mode: str = "full"
+    id_hash: str = "sha256"
+    normalize_embeddings: bool = False
+    query_cache_size: int = 0
+    query_cache_ttl: float = 300.0
 
     _db: Optional[velesdb.Database] = None
     _collection: Optional[velesdb.Collection] = None
     _dimension: Optional[int] = None
+    _query_cache: Optional[_ResultCache] = None
+    _info_cache: Optional[Tuple[float, dict]] = None
+    _id_fn: Callable[[str], int] = _stable_hash_id
+    _normalize: bool = False
+    _open_lock: Optional[threading.RLock] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -106,6 +413,10 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         collection_name: str = "llamaindex",
         metric: str = "cosine",
         storage_mode: str = "full",
+        id_hash: str = "sha256",
+        normalize_embeddings: bool = False,
+        query_cache_size: int = 0,
+        query_cache_ttl: float = 300.0,
         **kwargs: Any,
     ) -> None:
         """Initialize VelesDB vector store.
@@ -123,10 +434,28 @@ class VelesDBVectorStore(BasePydanticVectorStore):
                 - "full": Full f32 precision (default)
                 - "sq8": 8-bit scalar quantization (4x memory reduction)
                 - "binary": 1-bit binary quantization (32x memory reduction)
+            id_hash: How node IDs are hashed to VelesDB point IDs.
+                - "sha256": SHA256-based IDs (default, compatible with
+                  collections written by earlier versions)
+                - "xxh3": XXH3-64 IDs, faster (requires ``xxhash``); only
+                  use it for new collections
+            normalize_embeddings: With the cosine metric, scale stored and
+                query embeddings to unit length and create new collections
+                with the dot-product metric, which ranks unit vectors exactly
+                like cosine without per-comparison norms. Scores are
+                unchanged. Ignored for other metrics (default False).
+            query_cache_size: Number of query results kept in an LRU cache
+                for repeated identical queries (default 0, disabled). The
+                cache is cleared by writes through this store. Each hit
+                returns its own copy of the nodes and their metadata, so
+                callers can modify results safely.
+            query_cache_ttl: Seconds a cached result stays valid (default 300).
             **kwargs: Additional arguments.
             
         Raises:
             SecurityError: If any parameter fails validation.
+            ValueError: If ``id_hash`` is unknown.
+            ImportError: If ``id_hash="xxh3"`` and xxhash is not installed.
         """
         # Security: Validate all inputs
         validated_path = validate_path(path)
@@ -138,15 +467,52 @@ class VelesDBVectorStore(BasePydanticVectorStore):
             storage_mode=storage_mode,
             collection_name=validated_collection,
             metric=validated_metric,
+            id_hash=id_hash,
+            normalize_embeddings=normalize_embeddings,
+            query_cache_size=query_cache_size,
+            query_cache_ttl=query_cache_ttl,
             **kwargs,
         )
+        self._id_fn = _get_id_hasher(id_hash)
+        self._open_lock = threading.RLock()
+        self._normalize = normalize_embeddings and validated_metric == "cosine"
+        if query_cache_size > 0:
+            self._query_cache = _ResultCache(query_cache_size, query_cache_ttl)
 
     def _get_db(self) -> velesdb.Database:
         """Get or create the database connection."""
         if self._db is None:
-            self._db = velesdb.Database(self.path)
+            with self._open_lock:
+                if self._db is None:
+                    self._db = velesdb.Database(self.path)
         return self._db
 
+    def _cache_get(self, key: Hashable) -> Optional[VectorStoreQueryResult]:
+        """Look up a copy of a cached query result (None on miss or if disabled)."""
+        if self._query_cache is None:
+            return None
+        cached = self._query_cache.get(key)
+        return None if cached is None else _copy_result(cached)
+
+    def _cache_put(self, key: Hashable, result: VectorStoreQueryResult) -> None:
+        """Cache a copy of a query result if caching is enabled."""
+        if self._query_cache is not None:
+            self._query_cache.put(key, _copy_result(result))
+
+    def cache_clear(self) -> None:
+        """Drop all cached query results."""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def _query_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """Apply the store's embedding normalization to query vectors."""
+        return _l2_normalize(vectors) if self._normalize else vectors
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached query results and collection info after a write."""
+        self.cache_clear()
+        self._info_cache = None
+
     def _get_collection(self, dimension: int) -> velesdb.Collection:
         """Get or create the collection.
         
@@ -160,27 +526,47 @@ class VelesDBVectorStore(BasePydanticVectorStore):
             ValueError: If collection exists with different dimension.
         """
         if self._collection is None or self._dimension != dimension:
-            db = self._get_db()
+            with self._open_lock:
+                if self._collection is None or self._dimension != dimension:
+                    self._open_collection(dimension)
+        return self._collection
+
+    def _open_collection(self, dimension: int) -> None:
+        """Open or create the collection (caller holds ``_open_lock``)."""
+        db = self._get_db()
+        self._collection = db.get_collection(self.collection_name)
+        if self._collection is None:
+            self._collection = db.create_collection(
+                self.collection_name,
+                dimension=dimension,
+                metric="dot" if self._normalize else self.metric,
+                storage_mode=self.storage_mode,
+            )
             self._collection = db.get_collection(self.collection_name)
-            if self._collection is None:
-                self._collection = db.create_collection(
-                    self.collection_name,
-                    dimension=dimension,
-                    metric=self.metric,
+        else:
+            # Validate existing collection dimension matches
+            info = self._collection.info()
+            existing_dim = info.get("dimension", 0)
+            if existing_dim != 0 and existing_dim != dimension:
+                raise ValueError(
+                    f"Collection '{self.collection_name}' exists with dimension {existing_dim}, "
+                    f"but got vectors of dimension {dimension}. "
+                    f"Use a different collection name or matching dimension."
                 )
-                self._collection = db.get_collection(self.collection_name)
-            else:
-                # Validate existing collection dimension matches
-                info = self._collection.info()
-                existing_dim = info.get("dimension", 0)
-                if existing_dim != 0 and existing_dim != dimension:
-                    raise ValueError(
-                        f"Collection '{self.collection_name}' exists with dimension {existing_dim}, "
-                        f"but got vectors of dimension {dimension}. "
-                        f"Use a different collection name or matching dimension."
-                    )
-            self._dimension = dimension
-        return self._collection
+        self._dimension = dimension
+        self._info_cache = None
+
+    def _query_collection(self, embedding: Any) -> velesdb.Collection:
+        """Return the collection to search with ``embedding``.
+
+        Once a collection is open, its dimension is only re-checked in
+        debug mode; under ``python -O`` a mismatching query is rejected by
+        the engine instead of raising ValueError here.
+        """
+        collection = self._collection
+        if collection is None or (__debug__ and len(embedding) != self._dimension):
+            return self._get_collection(len(embedding))
+        return collection
 
     @property
     def client(self) -> velesdb.Database:
@@ -218,40 +604,11 @@ class VelesDBVectorStore(BasePydanticVectorStore):
 
         collection = self._get_collection(dimension)
 
-        points = []
-        ids = []
-
-        for node in nodes:
-            embedding = node.get_embedding()
-            if embedding is None:
-                continue
-
-            node_id = node.node_id
-            ids.append(node_id)
-
-            # Build payload
-            payload = {
-                "text": node.get_content(),
-                "node_id": node_id,
-            }
-
-            # Add metadata
-            if hasattr(node, "metadata") and node.metadata:
-                for key, value in node.metadata.items():
-                    if isinstance(value, (str, int, float, bool)):
-                        payload[key] = value
-
-            # Convert node_id to int for VelesDB
-            int_id = _stable_hash_id(node_id)
-
-            points.append({
-                "id": int_id,
-                "vector": embedding,
-                "payload": payload,
-            })
+        points, ids = _nodes_to_points(nodes, self._id_fn, self._normalize)
 
         if points:
             collection.upsert(points)
+            self._invalidate_caches()
 
         return ids
 
@@ -265,8 +622,9 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         if self._collection is None:
             return
 
-        int_id = _stable_hash_id(ref_doc_id)
+        int_id = self._id_fn(ref_doc_id)
         self._collection.delete([int_id])
+        self._invalidate_caches()
 
     def query(
         self,
@@ -285,50 +643,79 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         Raises:
             SecurityError: If parameters fail validation.
         """
+        return self._vector_query(query)
+
+    def _vector_query(
+        self,
+        query: VectorStoreQuery,
+        score_threshold: Optional[float] = None,
+    ) -> VectorStoreQueryResult:
+        """Run a vector query, dropping rows below ``score_threshold``.
+
+        Rows are filtered before hydration so no TextNode is built for a
+        discarded hit.
+        """
         if query.query_embedding is None:
             return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
 
-        dimension = len(query.query_embedding)
-        collection = self._get_collection(dimension)
+        collection = self._query_collection(query.query_embedding)
 
         k = query.similarity_top_k or 10
         
         # Security: Validate k
         validate_k(k)
 
-        results = collection.search(query.query_embedding, top_k=k)
+        vector = self._query_vectors(_to_f32(query.query_embedding))
+        cache_key = ("query", vector.tobytes(), k, repr(query.filters), score_threshold)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        nodes: List[TextNode] = []
-        similarities: List[float] = []
-        ids: List[str] = []
+        results = _filter_by_score(collection.search(vector, top_k=k), score_threshold)
 
-        for result in results:
-            payload = result.get("payload", {})
-            text = payload.get("text", "")
-            node_id = payload.get("node_id", str(result.get("id", "")))
-            score = result.get("score", 0.0)
+        result = _hydrate_results(results)
+        self._cache_put(cache_key, result)
+        return result
+
+    def query_ids_scores(
+        self,
+        query: VectorStoreQuery,
+        **kwargs: Any,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Run a vector query returning only node IDs and scores.
 
-            # Build metadata from remaining payload
-            metadata = {
-                k: v for k, v in payload.items()
-                if k not in ("text", "node_id")
-            }
+        No TextNode or metadata dict is built, which suits rerankers that
+        read content from another source.
 
-            node = TextNode(
-                text=text,
-                id_=node_id,
-                metadata=metadata,
-            )
+        Args:
+            query: Vector store query with embedding and parameters.
+            **kwargs: Additional arguments.
 
-            nodes.append(node)
-            similarities.append(score)
-            ids.append(node_id)
+        Returns:
+            Tuple of (object array of node IDs, float32 array of scores),
+            best match first.
 
-        return VectorStoreQueryResult(
-            nodes=nodes,
-            similarities=similarities,
-            ids=ids,
+        Raises:
+            SecurityError: If parameters fail validation.
+        """
+        if query.query_embedding is None:
+            return np.empty(0, dtype=object), np.empty(0, dtype=np.float32)
+
+        collection = self._query_collection(query.query_embedding)
+        k = query.similarity_top_k or 10
+        validate_k(k)
+
+        vector = self._query_vectors(_to_f32(query.query_embedding))
+        results = collection.search(vector, top_k=k)
+
+        ids = np.empty(len(results), dtype=object)
+        ids[:] = [
+            (r.get("payload") or {}).get("node_id") or str(r.get("id", "")) for r in results
+        ]
+        scores = np.fromiter(
+            (r.get("score", 0.0) for r in results), dtype=np.float32, count=len(results)
         )
+        return ids, scores
 
     def query_with_score_threshold(
         self,
@@ -360,20 +747,7 @@ class VelesDBVectorStore(BasePydanticVectorStore):
             ...     query, score_threshold=0.8
             ... )
         """
-        result = self.query(query, **kwargs)
-
-        if score_threshold > 0.0 and result.similarities:
-            filtered_indices = [
-                i for i, score in enumerate(result.similarities)
-                if score >= score_threshold
-            ]
-            return VectorStoreQueryResult(
-                nodes=[result.nodes[i] for i in filtered_indices] if result.nodes else [],
-                similarities=[result.similarities[i] for i in filtered_indices],
-                ids=[result.ids[i] for i in filtered_indices] if result.ids else [],
-            )
-
-        return result
+        return self._vector_query(query, score_threshold if score_threshold > 0.0 else None)
 
     def hybrid_query(
         self,
@@ -381,6 +755,7 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         query_embedding: List[float],
         similarity_top_k: int = 10,
         vector_weight: float = 0.5,
+        score_threshold: Optional[float] = None,
         **kwargs: Any,
     ) -> VectorStoreQueryResult:
         """Hybrid search combining vector similarity and BM25 text search.
@@ -392,6 +767,7 @@ class VelesDBVectorStore(BasePydanticVectorStore):
             query_embedding: Query embedding vector.
             similarity_top_k: Number of results to return.
             vector_weight: Weight for vector results (0.0-1.0). Defaults to 0.5.
+            score_threshold: Only return nodes with fused score >= threshold.
             **kwargs: Additional arguments.
 
         Returns:
@@ -405,46 +781,31 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         validate_k(similarity_top_k)
         validate_weight(vector_weight, "vector_weight")
         
-        dimension = len(query_embedding)
-        collection = self._get_collection(dimension)
+        collection = self._query_collection(query_embedding)
+
+        vector = self._query_vectors(_to_f32(query_embedding))
+        cache_key = (
+            "hybrid",
+            vector.tobytes(),
+            _bm25_terms(query_str) or query_str,
+            similarity_top_k,
+            vector_weight,
+            score_threshold,
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         results = collection.hybrid_search(
-            vector=query_embedding,
+            vector=vector,
             query=query_str,
             top_k=similarity_top_k,
             vector_weight=vector_weight,
         )
 
-        nodes: List[TextNode] = []
-        similarities: List[float] = []
-        ids: List[str] = []
-
-        for result in results:
-            payload = result.get("payload", {})
-            text = payload.get("text", "")
-            node_id = payload.get("node_id", str(result.get("id", "")))
-            score = result.get("score", 0.0)
-
-            metadata = {
-                k: v for k, v in payload.items()
-                if k not in ("text", "node_id")
-            }
-
-            node = TextNode(
-                text=text,
-                id_=node_id,
-                metadata=metadata,
-            )
-
-            nodes.append(node)
-            similarities.append(score)
-            ids.append(node_id)
-
-        return VectorStoreQueryResult(
-            nodes=nodes,
-            similarities=similarities,
-            ids=ids,
-        )
+        result = _hydrate_results(_filter_by_score(results, score_threshold))
+        self._cache_put(cache_key, result)
+        return result
 
     def text_query(
         self,
@@ -472,46 +833,44 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         if self._collection is None:
             return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
 
-        results = self._collection.text_search(query_str, top_k=similarity_top_k)
+        terms = _bm25_terms(query_str)
+        if terms == ():
+            # The engine returns nothing for a query without terms
+            return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
 
-        nodes: List[TextNode] = []
-        similarities: List[float] = []
-        ids: List[str] = []
-
-        for result in results:
-            payload = result.get("payload", {})
-            text = payload.get("text", "")
-            node_id = payload.get("node_id", str(result.get("id", "")))
-            score = result.get("score", 0.0)
-
-            metadata = {
-                k: v for k, v in payload.items()
-                if k not in ("text", "node_id")
-            }
-
-            node = TextNode(
-                text=text,
-                id_=node_id,
-                metadata=metadata,
-            )
+        cache_key = ("text", query_str if terms is None else terms, similarity_top_k)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-            nodes.append(node)
-            similarities.append(score)
-            ids.append(node_id)
+        results = self._collection.text_search(query_str, top_k=similarity_top_k)
 
-        return VectorStoreQueryResult(
-            nodes=nodes,
-            similarities=similarities,
-            ids=ids,
-        )
+        result = _hydrate_results(results)
+        self._cache_put(cache_key, result)
+        return result
 
     def batch_query(
         self,
         queries: List[VectorStoreQuery],
+        parallel_hydrate: Optional[bool] = None,
         **kwargs: Any,
     ) -> List[VectorStoreQueryResult]:
         """Batch query with multiple embeddings in parallel.
         
+        Args:
+            queries: Queries to run in one native batch search.
+            parallel_hydrate: Build result nodes on a thread pool. ``None``
+                (default) enables it for batches of at least
+                ``PARALLEL_HYDRATE_MIN_BATCH`` queries when the interpreter
+                runs without the GIL; with the GIL, node construction does
+                not scale across threads.
+            **kwargs: Additional arguments.
+        
+        Returns:
+            One result per query, in order. Queries without an embedding get
+            an empty result; queries with the same embedding and top-k are
+            searched once and share the same result object.
+        
         Raises:
             SecurityError: If batch size exceeds limit.
         """
@@ -526,30 +885,125 @@ class VelesDBVectorStore(BasePydanticVectorStore):
             return [VectorStoreQueryResult(nodes=[], similarities=[], ids=[]) 
                     for _ in queries]
 
-        dimension = len(first_emb)
-        collection = self._get_collection(dimension)
+        collection = self._query_collection(first_emb)
+
+        valid = [(i, q) for i, q in enumerate(queries) if q.query_embedding is not None]
+        matrix = np.stack([_to_f32(q.query_embedding) for _, q in valid])
+        results = self._batch_search(
+            collection,
+            matrix,
+            [q.similarity_top_k or 10 for _, q in valid],
+            parallel_hydrate,
+        )
 
-        searches = [{"vector": q.query_embedding, "top_k": q.similarity_top_k or 10}
-                    for q in queries if q.query_embedding is not None]
+        aligned = [VectorStoreQueryResult(nodes=[], similarities=[], ids=[]) for _ in queries]
+        for (i, _), result in zip(valid, results):
+            aligned[i] = result
+        return aligned
+
+    def batch_query_matrix(
+        self,
+        query_embeddings: np.ndarray,
+        similarity_top_k: int = 10,
+        parallel_hydrate: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> List[VectorStoreQueryResult]:
+        """Batch query with the rows of a ``(Q, d)`` embedding matrix.
+
+        Same native batch search as :meth:`batch_query`, without building
+        a ``VectorStoreQuery`` (and its list-of-floats embedding) per row.
+
+        Args:
+            query_embeddings: 2-D array whose rows are the query embeddings.
+            similarity_top_k: Number of results per query.
+            parallel_hydrate: See :meth:`batch_query`.
+            **kwargs: Additional arguments.
+
+        Returns:
+            One result per row, in order.
+
+        Raises:
+            SecurityError: If batch size or top-k exceeds limits.
+        """
+        if len(query_embeddings) == 0:
+            return []
+
+        validate_batch_size(len(query_embeddings))
+        validate_k(similarity_top_k)
+
+        matrix = np.ascontiguousarray(query_embeddings, dtype=np.float32)
+        collection = self._query_collection(matrix[0])
+        return self._batch_search(
+            collection, matrix, [similarity_top_k] * len(matrix), parallel_hydrate
+        )
+
+    def _batch_search(
+        self,
+        collection: velesdb.Collection,
+        matrix: np.ndarray,
+        top_ks: List[int],
+        parallel_hydrate: Optional[bool],
+    ) -> List[VectorStoreQueryResult]:
+        """Run one native batch search over the rows of ``matrix``.
+
+        Identical (vector, top_k) pairs are searched once; repeats get
+        their own copy of the result, so callers can edit each in place.
+        """
+        matrix = self._query_vectors(matrix)
+        searches: List[dict] = []
+        slot_of: dict = {}
+        slots: List[int] = []
+        for row, top_k in zip(matrix, top_ks):
+            key = (row.tobytes(), top_k)
+            slot = slot_of.get(key)
+            if slot is None:
+                slot = slot_of[key] = len(searches)
+                searches.append({"vector": row, "top_k": top_k})
+            slots.append(slot)
 
         batch_results = collection.batch_search(searches)
 
-        all_results: List[VectorStoreQueryResult] = []
-        for res_list in batch_results:
-            n_list, s_list, i_list = [], [], []
-            for r in res_list:
-                p = r.get("payload", {})
-                nid = p.get("node_id", str(r.get("id", "")))
-                n_list.append(TextNode(text=p.get("text", ""), id_=nid,
-                    metadata={k: v for k, v in p.items() if k not in ("text", "node_id")}))
-                s_list.append(r.get("score", 0.0))
-                i_list.append(nid)
-            all_results.append(VectorStoreQueryResult(nodes=n_list, similarities=s_list, ids=i_list))
-        return all_results
-
-    def add_bulk(self, nodes: List[BaseNode], **add_kwargs: Any) -> List[str]:
+        if parallel_hydrate is None:
+            parallel_hydrate = (
+                len(batch_results) >= PARALLEL_HYDRATE_MIN_BATCH and not _gil_enabled()
+            )
+        if parallel_hydrate and len(batch_results) > 1:
+            workers = min(_MAX_HYDRATE_WORKERS, len(batch_results))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                hydrated = list(executor.map(_hydrate_results, batch_results))
+        else:
+            hydrated = [_hydrate_results(res_list) for res_list in batch_results]
+        results: List[VectorStoreQueryResult] = []
+        seen: set = set()
+        for slot in slots:
+            if slot in seen:
+                results.append(_copy_result(hydrated[slot]))
+            else:
+                seen.add(slot)
+                results.append(hydrated[slot])
+        return results
+
+    def add_bulk(
+        self,
+        nodes: List[BaseNode],
+        batch_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        **add_kwargs: Any,
+    ) -> List[str]:
         """Bulk insert optimized for large batches.
         
+        Nodes are converted and sent to the collection in chunks of
+        ``batch_size`` so only one chunk of points is alive at a time.
+        Chunks are committed independently: if a chunk fails, earlier
+        chunks remain stored.
+        
+        Args:
+            nodes: List of nodes with embeddings to add.
+            batch_size: Number of nodes converted and upserted per chunk.
+            **add_kwargs: Additional arguments.
+        
+        Returns:
+            List of node IDs that were added.
+        
         Raises:
             SecurityError: If batch size exceeds limit.
         """
@@ -558,52 +1012,60 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         
         # Security: Validate batch size
         validate_batch_size(len(nodes))
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         
         first_emb = nodes[0].get_embedding()
         if first_emb is None:
             raise ValueError("Nodes must have embeddings")
         collection = self._get_collection(len(first_emb))
 
-        points, result_ids = [], []
-        for node in nodes:
-            emb = node.get_embedding()
-            if emb is None:
-                continue
-            nid = node.node_id
-            result_ids.append(nid)
-            payload = {"text": node.get_content(), "node_id": nid}
-            if hasattr(node, "metadata") and node.metadata:
-                payload.update({k: v for k, v in node.metadata.items() 
-                               if isinstance(v, (str, int, float, bool))})
-            points.append({"id": _stable_hash_id(nid), "vector": emb, "payload": payload})
-        if points:
-            collection.upsert_bulk(points)
+        result_ids: List[str] = []
+        try:
+            for start in range(0, len(nodes), batch_size):
+                chunk = nodes[start:start + batch_size]
+                points, chunk_ids = _nodes_to_points(chunk, self._id_fn, self._normalize)
+                if points:
+                    collection.upsert_bulk(points)
+                del points
+                result_ids.extend(chunk_ids)
+        finally:
+            if result_ids:
+                self._invalidate_caches()
         return result_ids
 
     def get_nodes(self, node_ids: List[str], **kwargs: Any) -> List[TextNode]:
         """Retrieve nodes by their IDs."""
         if not node_ids or self._collection is None:
             return []
-        int_ids = [_stable_hash_id(nid) for nid in node_ids]
+        id_fn = self._id_fn
+        int_ids = [id_fn(nid) for nid in node_ids]
         points = self._collection.get(int_ids)
-        result = []
-        for pt in points:
-            if pt:
-                p = pt.get("payload", {})
-                result.append(TextNode(text=p.get("text", ""), id_=p.get("node_id", ""),
-                    metadata={k: v for k, v in p.items() if k not in ("text", "node_id")}))
-        return result
+        return _hydrate_results([pt for pt in points if pt]).nodes
 
     def get_collection_info(self) -> dict:
-        """Get collection configuration information."""
+        """Get collection configuration information.
+
+        The native result is reused for ``INFO_CACHE_TTL`` seconds unless a
+        write goes through this store. When the query cache is enabled, its
+        counters are reported under the ``"query_cache"`` key.
+        """
         if self._collection is None:
-            return {"name": self.collection_name, "dimension": 0, "metric": self.metric, "point_count": 0}
-        return self._collection.info()
+            info = {"name": self.collection_name, "dimension": 0, "metric": self.metric, "point_count": 0}
+        else:
+            now = time.monotonic()
+            if self._info_cache is None or now - self._info_cache[0] >= INFO_CACHE_TTL:
+                self._info_cache = (now, self._collection.info())
+            info = dict(self._info_cache[1])
+        if self._query_cache is not None:
+            info["query_cache"] = self._query_cache.stats()
+        return info
 
     def flush(self) -> None:
         """Flush all pending changes to disk."""
         if self._collection is not None:
             self._collection.flush()
+            self._info_cache = None
 
     def is_empty(self) -> bool:
         """Check if the collection is empty."""
@@ -636,22 +1098,15 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         if self._collection is None:
             return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
         results = self._collection.query(query_str, params)
-        n_list, s_list, i_list = [], [], []
-        for r in results:
-            p = r.get("payload", {})
-            nid = p.get("node_id", str(r.get("id", "")))
-            n_list.append(TextNode(text=p.get("text", ""), id_=nid,
-                metadata={k: v for k, v in p.items() if k not in ("text", "node_id")}))
-            s_list.append(r.get("score", 0.0))
-            i_list.append(nid)
-        return VectorStoreQueryResult(nodes=n_list, similarities=s_list, ids=i_list)
+        return _hydrate_results(results)
 
     def multi_query_search(
         self,
-        query_embeddings: List[List[float]],
+        query_embeddings: Union[List[List[float]], np.ndarray],
         similarity_top_k: int = 10,
         fusion: str = "rrf",
         fusion_params: Optional[dict] = None,
+        score_threshold: Optional[float] = None,
         **kwargs: Any,
     ) -> VectorStoreQueryResult:
         """Multi-query fusion search combining results from multiple query embeddings.
@@ -660,12 +1115,14 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         ideal for RAG pipelines using Multiple Query Generation (MQG).
 
         Args:
-            query_embeddings: List of query embedding vectors.
+            query_embeddings: List of query embedding vectors, or a 2-D
+                ``(Q, d)`` array whose rows are the queries.
             similarity_top_k: Number of results to return.
             fusion: Fusion strategy ("rrf", "average", "maximum", "weighted").
             fusion_params: Parameters for fusion strategy:
                 - RRF: {"k": 60} (default k=60)
                 - Weighted: {"avg_weight": 0.6, "max_weight": 0.3, "hit_weight": 0.1}
+            score_threshold: Only return nodes with fused score >= threshold.
             **kwargs: Additional arguments.
 
         Returns:
@@ -679,11 +1136,10 @@ class VelesDBVectorStore(BasePydanticVectorStore):
             ...     fusion_params={"k": 60}
             ... )
         """
-        if not query_embeddings:
+        if len(query_embeddings) == 0:
             return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
 
-        dimension = len(query_embeddings[0])
-        collection = self._get_collection(dimension)
+        collection = self._query_collection(query_embeddings[0])
 
         # Build fusion strategy
         fusion_params = fusion_params or {}
@@ -704,39 +1160,93 @@ class VelesDBVectorStore(BasePydanticVectorStore):
         else:
             fusion_strategy = velesdb.FusionStrategy.rrf(k=60)
 
+        # Rows of one contiguous (Q, d) matrix
+        if isinstance(query_embeddings, np.ndarray):
+            matrix = np.ascontiguousarray(query_embeddings, dtype=np.float32)
+        else:
+            matrix = np.stack([_to_f32(emb) for emb in query_embeddings])
+        vectors = list(self._query_vectors(matrix))
+        if fusion == "maximum":
+            # Max fusion ignores repeats, so duplicate embeddings are searched once
+            vectors = list({row.tobytes(): row for row in vectors}.values())
+
         results = collection.multi_query_search(
-            vectors=query_embeddings,
+            vectors=vectors,
             top_k=similarity_top_k,
             fusion=fusion_strategy,
         )
 
-        nodes: List[TextNode] = []
-        similarities: List[float] = []
-        ids: List[str] = []
-
-        for result in results:
-            payload = result.get("payload", {})
-            text = payload.get("text", "")
-            node_id = payload.get("node_id", str(result.get("id", "")))
-            score = result.get("score", 0.0)
-
-            metadata = {
-                k: v for k, v in payload.items()
-                if k not in ("text", "node_id")
-            }
-
-            node = TextNode(
-                text=text,
-                id_=node_id,
-                metadata=metadata,
-            )
+        return _hydrate_results(_filter_by_score(results, score_threshold))
 
-            nodes.append(node)
-            similarities.append(score)
-            ids.append(node_id)
+    async def async_add(self, nodes: List[BaseNode], **add_kwargs: Any) -> List[str]:
+        """Asynchronously add nodes; runs :meth:`add` in a worker thread."""
+        return await asyncio.to_thread(self.add, nodes, **add_kwargs)
 
-        return VectorStoreQueryResult(
-            nodes=nodes,
-            similarities=similarities,
-            ids=ids,
+    async def aadd_bulk(
+        self,
+        nodes: List[BaseNode],
+        batch_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        **add_kwargs: Any,
+    ) -> List[str]:
+        """Asynchronously bulk insert; runs :meth:`add_bulk` in a worker thread."""
+        return await asyncio.to_thread(self.add_bulk, nodes, batch_size, **add_kwargs)
+
+    async def adelete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
+        """Asynchronously delete; runs :meth:`delete` in a worker thread."""
+        await asyncio.to_thread(self.delete, ref_doc_id, **delete_kwargs)
+
+    async def aquery(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
+        """Asynchronously query; runs :meth:`query` in a worker thread."""
+        return await asyncio.to_thread(self.query, query, **kwargs)
+
+    async def aget_nodes(
+        self,
+        node_ids: Optional[List[str]] = None,
+        filters: Optional[Any] = None,
+    ) -> List[TextNode]:
+        """Asynchronously retrieve nodes by ID; runs :meth:`get_nodes` in a worker thread."""
+        return await asyncio.to_thread(self.get_nodes, node_ids or [])
+
+    async def abatch_query(
+        self,
+        queries: List[VectorStoreQuery],
+        **kwargs: Any,
+    ) -> List[VectorStoreQueryResult]:
+        """Asynchronously batch query; runs :meth:`batch_query` in a worker thread.
+
+        The batch is not split across threads: the native batch search
+        already runs the queries in parallel.
+        """
+        return await asyncio.to_thread(self.batch_query, queries, **kwargs)
+
+    async def abatch_query_matrix(
+        self,
+        query_embeddings: np.ndarray,
+        similarity_top_k: int = 10,
+        **kwargs: Any,
+    ) -> List[VectorStoreQueryResult]:
+        """Asynchronously run :meth:`batch_query_matrix` in a worker thread."""
+        return await asyncio.to_thread(
+            self.batch_query_matrix, query_embeddings, similarity_top_k, **kwargs
         )
+
+    async def ahybrid_query(
+        self,
+        query_str: str,
+        query_embedding: List[float],
+        **kwargs: Any,
+    ) -> VectorStoreQueryResult:
+        """Asynchronously run :meth:`hybrid_query` in a worker thread."""
+        return await asyncio.to_thread(self.hybrid_query, query_str, query_embedding, **kwargs)
+
+    async def atext_query(self, query_str: str, **kwargs: Any) -> VectorStoreQueryResult:
+        """Asynchronously run :meth:`text_query` in a worker thread."""
+        return await asyncio.to_thread(self.text_query, query_str, **kwargs)
+
+    async def amulti_query_search(
+        self,
+        query_embeddings: List[List[float]],
+        **kwargs: Any,
+    ) -> VectorStoreQueryResult:
+        """Asynchronously run :meth:`multi_query_search` in a worker thread."""
+        return await asyncio.to_thread(self.multi_query_search, query_embeddings, **kwargs)
@@ -0,0 +1,65 @@
+"""Shared fixtures for the VelesDB LlamaIndex tests.
+
+Every store lives under ``tmp_path``/``tmp_path_factory``, which pytest-xdist
+keeps separate per worker, so the suite runs in parallel with
+``pytest -n auto tests/``.
+
+Set ``VELESDB_TEST_TMP`` to a tmpfs mount (e.g. ``/dev/shm``) to keep the
+test databases in memory: ``VELESDB_TEST_TMP=/dev/shm pytest tests/``.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from llamaindex_velesdb import VelesDBVectorStore
+
+EMBEDDING_DIM = 768
+
+
+def pytest_configure(config):
+    """Root the session temp dir under ``$VELESDB_TEST_TMP`` when it is set.
+
+    An explicit ``--basetemp`` wins. pytest clears the base temp dir at the
+    start of each session, so it is always a dedicated subdirectory.
+    """
+    root = os.environ.get("VELESDB_TEST_TMP")
+    if root and config.option.basetemp is None and os.path.isdir(root):
+        config.option.basetemp = Path(root) / "velesdb-pytest"
+
+
+@functools.lru_cache(maxsize=None)
+def make_emb(scale: float, prefix: tuple = ()) -> np.ndarray:
+    """Return a cached, read-only 768-d float32 embedding.
+
+    The vector starts with ``prefix`` and is padded with ``scale``, so
+    ``make_emb(0.0, (0.1, 0.2, 0.3))`` is ``[0.1, 0.2, 0.3] + [0.0] * 765``.
+    """
+    arr = np.full(EMBEDDING_DIM, scale, dtype=np.float32)
+    arr[:len(prefix)] = prefix
+    arr.setflags(write=False)
+    return arr
+
+
+@pytest.fixture
+def embedding_factory():
+    """Factory for shared float32 query embeddings."""
+    return make_emb
+
+
+@pytest.fixture
+def store_factory(tmp_path_factory):
+    """Build stores under the session temp root, one fresh directory each.
+
+    Directories are cleaned up with the session rather than per test. Each
+    store still opens its own database: the engine keeps every open
+    collection resident, so one database shared across tests would grow
+    by hundreds of MB per test.
+    """
+    def make(**kwargs) -> VelesDBVectorStore:
+        return VelesDBVectorStore(path=str(tmp_path_factory.mktemp("store")), **kwargs)
+
+    return make
@@ -6,27 +6,44 @@ US-044: Knowledge Graph → LlamaIndex
 import pytest
 from unittest.mock import MagicMock, patch
 
+from llamaindex_velesdb import GraphLoader
+
+
+@pytest.fixture(scope="module")
+def mock_pair():
+    """One (mock_store, mock_collection) pair shared by the whole module."""
+    return MagicMock(), MagicMock()
+
+
+@pytest.fixture
+def graph_loader_with_mock(mock_pair):
+    """GraphLoader over the shared store with a freshly reset collection."""
+    mock_store, mock_collection = mock_pair
+    mock_collection.reset_mock(return_value=True, side_effect=True)
+    mock_store._collection = mock_collection
+    return GraphLoader(mock_store), mock_collection
+
+
+@pytest.fixture
+def mock_store_uninitialized(mock_pair):
+    """The shared store with no collection opened yet."""
+    mock_store, _ = mock_pair
+    mock_store._collection = None
+    return mock_store
+
 
 class TestGraphLoader:
     """Tests for GraphLoader class."""
 
-    def test_init(self):
+    def test_init(self, mock_pair):
         """Test GraphLoader initialization."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
+        mock_store, _ = mock_pair
         loader = GraphLoader(mock_store)
         assert loader._vector_store is mock_store
 
-    def test_add_node_with_metadata(self):
+    def test_add_node_with_metadata(self, graph_loader_with_mock):
         """Test adding a node with metadata."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_store._collection = mock_collection
-
-        loader = GraphLoader(mock_store)
+        loader, mock_collection = graph_loader_with_mock
         loader.add_node(id=1, label="PERSON", metadata={"name": "John"})
 
         mock_collection.add_node.assert_called_once_with(
@@ -35,15 +52,9 @@ class TestGraphLoader:
             metadata={"name": "John"}
         )
 
-    def test_add_node_with_vector(self):
+    def test_add_node_with_vector(self, graph_loader_with_mock):
         """Test adding a node with embedding vector."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_store._collection = mock_collection
-
-        loader = GraphLoader(mock_store)
+        loader, mock_collection = graph_loader_with_mock
         vector = [0.1, 0.2, 0.3]
         loader.add_node(id=1, label="DOCUMENT", vector=vector)
 
@@ -53,15 +64,9 @@ class TestGraphLoader:
         assert call_args["vector"] == vector
         assert call_args["payload"]["label"] == "DOCUMENT"
 
-    def test_add_edge(self):
+    def test_add_edge(self, graph_loader_with_mock):
         """Test adding an edge."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_store._collection = mock_collection
-
-        loader = GraphLoader(mock_store)
+        loader, mock_collection = graph_loader_with_mock
         loader.add_edge(id=1, source=100, target=200, label="KNOWS")
 
         mock_collection.add_edge.assert_called_once_with(
@@ -72,15 +77,9 @@ class TestGraphLoader:
             metadata={}
         )
 
-    def test_add_edge_with_metadata(self):
+    def test_add_edge_with_metadata(self, graph_loader_with_mock):
         """Test adding an edge with properties."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_store._collection = mock_collection
-
-        loader = GraphLoader(mock_store)
+        loader, mock_collection = graph_loader_with_mock
         loader.add_edge(
             id=1,
             source=100,
@@ -97,61 +96,40 @@ class TestGraphLoader:
             metadata={"since": "2024-01-01"}
         )
 
-    def test_get_edges_by_label(self):
+    def test_get_edges_by_label(self, graph_loader_with_mock):
         """Test getting edges filtered by label."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
+        loader, mock_collection = graph_loader_with_mock
         mock_collection.get_edges_by_label.return_value = [
             {"id": 1, "source": 100, "target": 200, "label": "KNOWS", "properties": {}}
         ]
-        mock_store._collection = mock_collection
-
-        loader = GraphLoader(mock_store)
         edges = loader.get_edges(label="KNOWS")
 
         mock_collection.get_edges_by_label.assert_called_once_with("KNOWS")
         assert len(edges) == 1
         assert edges[0]["label"] == "KNOWS"
 
-    def test_get_edges_all(self):
+    def test_get_edges_all(self, graph_loader_with_mock):
         """Test getting all edges without filter."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
+        loader, mock_collection = graph_loader_with_mock
         mock_collection.get_edges.return_value = [
             {"id": 1, "source": 100, "target": 200, "label": "KNOWS", "properties": {}},
             {"id": 2, "source": 200, "target": 300, "label": "FOLLOWS", "properties": {}}
         ]
-        mock_store._collection = mock_collection
-
-        loader = GraphLoader(mock_store)
         edges = loader.get_edges()
 
         mock_collection.get_edges.assert_called_once()
         assert len(edges) == 2
 
-    def test_get_edges_empty_collection(self):
+    def test_get_edges_empty_collection(self, mock_store_uninitialized):
         """Test getting edges from uninitialized collection."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_store._collection = None
-
-        loader = GraphLoader(mock_store)
+        loader = GraphLoader(mock_store_uninitialized)
         edges = loader.get_edges()
 
         assert edges == []
 
-    def test_load_from_nodes(self):
+    def test_load_from_nodes(self, graph_loader_with_mock):
         """Test loading LlamaIndex nodes as graph nodes."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_store._collection = mock_collection
+        loader, mock_collection = graph_loader_with_mock
 
         # Mock LlamaIndex node
         mock_node = MagicMock()
@@ -159,24 +137,19 @@ class TestGraphLoader:
         mock_node.get_content.return_value = "Test content"
         mock_node.metadata = {"source": "test.txt"}
 
-        loader = GraphLoader(mock_store)
         result = loader.load_from_nodes([mock_node], node_label="DOCUMENT")
 
         assert result["nodes"] == 1
         assert result["edges"] == 0
         mock_collection.add_node.assert_called_once()
 
-    def test_load_from_nodes_with_none_content(self):
+    def test_load_from_nodes_with_none_content(self, graph_loader_with_mock):
         """Test loading nodes when get_content() returns None.
         
         Regression test: TypeError when node.get_content() returns None.
         Some LlamaIndex nodes may have no content (e.g., ImageNode without text).
         """
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
-        mock_store._collection = mock_collection
+        loader, mock_collection = graph_loader_with_mock
 
         # Mock LlamaIndex node with None content
         mock_node = MagicMock()
@@ -184,7 +157,6 @@ class TestGraphLoader:
         mock_node.get_content.return_value = None  # This caused TypeError
         mock_node.metadata = {"source": "image.png"}
 
-        loader = GraphLoader(mock_store)
         # Should NOT raise TypeError: 'NoneType' object is not subscriptable
         result = loader.load_from_nodes([mock_node], node_label="IMAGE")
 
@@ -196,26 +168,16 @@ class TestGraphLoader:
         call_args = mock_collection.add_node.call_args
         assert call_args[1]["metadata"]["text_preview"] == ""
 
-    def test_add_node_no_collection_raises(self):
+    def test_add_node_no_collection_raises(self, mock_store_uninitialized):
         """Test that add_node raises when collection not initialized."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_store._collection = None
-
-        loader = GraphLoader(mock_store)
+        loader = GraphLoader(mock_store_uninitialized)
 
         with pytest.raises(ValueError, match="Collection not initialized"):
             loader.add_node(id=1, label="TEST")
 
-    def test_add_edge_no_collection_raises(self):
+    def test_add_edge_no_collection_raises(self, mock_store_uninitialized):
         """Test that add_edge raises when collection not initialized."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_store._collection = None
-
-        loader = GraphLoader(mock_store)
+        loader = GraphLoader(mock_store_uninitialized)
 
         with pytest.raises(ValueError, match="Collection not initialized"):
             loader.add_edge(id=1, source=1, target=2, label="TEST")
@@ -227,18 +189,12 @@ class TestGraphLoaderIntegration:
     These tests verify the full flow without real VelesDB.
     """
 
-    def test_full_graph_construction_flow(self):
+    def test_full_graph_construction_flow(self, graph_loader_with_mock):
         """Test complete graph construction workflow."""
-        from llamaindex_velesdb import GraphLoader
-
-        mock_store = MagicMock()
-        mock_collection = MagicMock()
+        loader, mock_collection = graph_loader_with_mock
         mock_collection.get_edges_by_label.return_value = [
             {"id": 1, "source": 100, "target": 200, "label": "KNOWS", "properties": {}}
         ]
-        mock_store._collection = mock_collection
-
-        loader = GraphLoader(mock_store)
 
         # Add nodes
         loader.add_node(id=100, label="PERSON", metadata={"name": "Alice"})
@@ -0,0 +1,334 @@
+"""Tests for VelesDB LlamaIndex GraphRetriever."""
+
+import asyncio
+import functools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from llamaindex_velesdb import GraphRetriever, SecurityError
+
+
+def make_index(seed_ids, neighbor_ids=()):
+    """Build a mock index returning seed nodes and resolving neighbors."""
+    seeds = [
+        NodeWithScore(node=TextNode(text=f"seed {i}", metadata={"id": i}), score=0.9)
+        for i in seed_ids
+    ]
+    index = MagicMock()
+    index.as_retriever.return_value.retrieve.return_value = seeds
+    index.as_retriever.return_value.aretrieve = AsyncMock(return_value=seeds)
+    index._vector_store.get_by_id.side_effect = (
+        lambda nid: TextNode(text=f"neighbor {nid}", metadata={"id": nid})
+        if nid in neighbor_ids else None
+    )
+    return index
+
+
+def use_transport(monkeypatch, handler):
+    """Route the retriever's HTTP traffic to an in-process handler."""
+    transport = httpx.MockTransport(handler)
+    for name in ("Client", "AsyncClient"):
+        cls = getattr(httpx, name)
+        monkeypatch.setattr(httpx, name, functools.partial(cls, transport=transport))
+
+
+@pytest.fixture
+def graph_server():
+    """Serve traversal requests on localhost, echoing source + 100."""
+    sources = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            sources.append(payload["source"])
+            body = json.dumps({"results": [{"target_id": payload["source"] + 100}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", sources
+    server.shutdown()
+    server.server_close()
+
+
+class TestGraphRetriever:
+    """Tests for GraphRetriever class."""
+
+    def test_expands_every_seed(self, monkeypatch):
+        """Test that each seed is traversed and neighbors are appended."""
+        sources = []
+
+        def handler(request):
+            source = json.loads(request.content)["source"]
+            sources.append(source)
+            return httpx.Response(200, json={"results": [{"target_id": source + 100}]})
+
+        use_transport(monkeypatch, handler)
+        index = make_index([1, 2], neighbor_ids={101, 102})
+        retriever = GraphRetriever(index=index, collection_name="docs", expand_k=4)
+
+        nodes = retriever.retrieve("query")
+
+        assert sorted(sources) == [1, 2]
+        assert [n.node.metadata["graph_depth"] for n in nodes] == [0, 0, 1, 1]
+        assert {n.node.metadata["id"] for n in nodes} == {1, 2, 101, 102}
+        assert all(n.node.metadata["retrieval_mode"] == "graph_expanded" for n in nodes)
+
+    def test_seeds_filtered_client_side(self, monkeypatch):
+        """Test that seeds returned as neighbors are dropped on the client."""
+        payloads = []
+
+        def handler(request):
+            payload = json.loads(request.content)
+            payloads.append(payload)
+            other_seed = 3 - payload["source"]
+            return httpx.Response(
+                200, json={"results": [{"target_id": other_seed}, {"target_id": 101}]}
+            )
+
+        use_transport(monkeypatch, handler)
+        index = make_index([2, 1], neighbor_ids={1, 2, 101})
+        retriever = GraphRetriever(index=index, collection_name="docs", expand_k=5)
+
+        nodes = retriever.retrieve("query")
+
+        assert all("exclude" not in p and p["limit"] == 10 for p in payloads)
+        assert [n.node.metadata["id"] for n in nodes] == [2, 1, 101]
+
+    def test_neighbor_ids_above_int64_range(self, monkeypatch):
+        """Test that u64 node IDs at or above 2**63 survive parsing."""
+        big = 2**64 - 1
+
+        def handler(request):
+            return httpx.Response(200, json={"results": [{"target_id": big}]})
+
+        use_transport(monkeypatch, handler)
+        retriever = GraphRetriever(
+            index=make_index([1], neighbor_ids={big}), collection_name="docs"
+        )
+
+        nodes = retriever.retrieve("query")
+
+        assert [n.node.metadata["id"] for n in nodes] == [1, big]
+
+    def test_timeout_falls_back_to_vector_only(self, monkeypatch):
+        """Test that a traversal timeout yields seed nodes only."""
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        use_transport(monkeypatch, handler)
+        retriever = GraphRetriever(index=make_index([1, 2]), collection_name="docs")
+
+        nodes = retriever.retrieve("query")
+
+        assert [n.node.metadata["id"] for n in nodes] == [1, 2]
+        assert all(n.node.metadata["retrieval_mode"] == "vector_fallback" for n in nodes)
+
+    def test_timeout_raises_without_fallback(self, monkeypatch):
+        """Test that timeouts propagate when fallback is disabled."""
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        use_transport(monkeypatch, handler)
+        retriever = GraphRetriever(
+            index=make_index([1]), collection_name="docs", fallback_on_timeout=False
+        )
+
+        with pytest.raises(httpx.TimeoutException):
+            retriever.retrieve("query")
+
+    @pytest.mark.asyncio
+    async def test_low_latency_skips_graph(self, monkeypatch):
+        """Test that low latency mode never calls the graph endpoint."""
+        def handler(request):
+            raise AssertionError("graph endpoint must not be called")
+
+        use_transport(monkeypatch, handler)
+        retriever = GraphRetriever(
+            index=make_index([1, 2, 3]), collection_name="docs", low_latency=True, expand_k=2
+        )
+
+        nodes = await retriever.aretrieve("query")
+
+        assert [n.node.metadata["id"] for n in nodes] == [1, 2]
+        assert all(n.node.metadata["retrieval_mode"] == "vector_only" for n in nodes)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_traversals(self, monkeypatch):
+        """Test that concurrent queries traverse a shared seed only once."""
+        sources = []
+
+        def handler(request):
+            source = json.loads(request.content)["source"]
+            sources.append(source)
+            return httpx.Response(200, json={"results": [{"target_id": source + 100}]})
+
+        use_transport(monkeypatch, handler)
+        index = make_index([1, 2], neighbor_ids={101, 102})
+        retriever = GraphRetriever(index=index, collection_name="docs", dispatch_timeout_ms=5)
+
+        first, second = await asyncio.gather(
+            retriever.aretrieve("query"), retriever.aretrieve("query")
+        )
+
+        assert sorted(sources) == [1, 2]
+        assert len(first) == len(second) == 4
+
+    @pytest.mark.asyncio
+    async def test_overlapping_seed_sets_share_traversals(self, monkeypatch):
+        """Test that queries with different, overlapping seeds share traversals."""
+        sources = []
+
+        def handler(request):
+            source = json.loads(request.content)["source"]
+            sources.append(source)
+            # Every seed links to the next one and to its own neighbor
+            return httpx.Response(
+                200, json={"results": [{"target_id": source + 1}, {"target_id": source + 100}]}
+            )
+
+        use_transport(monkeypatch, handler)
+        index = make_index([], neighbor_ids={2, 3, 4, 101, 102, 103})
+        seeds = {
+            query: [
+                NodeWithScore(node=TextNode(text=f"seed {i}", metadata={"id": i}), score=0.9)
+                for i in ids
+            ]
+            for query, ids in (("first", [1, 2]), ("second", [2, 3]))
+        }
+        index.as_retriever.return_value.aretrieve = AsyncMock(side_effect=seeds.__getitem__)
+        retriever = GraphRetriever(
+            index=index, collection_name="docs", expand_k=10, dispatch_timeout_ms=5
+        )
+
+        first, second = await asyncio.gather(
+            retriever.aretrieve("first"), retriever.aretrieve("second")
+        )
+
+        assert sorted(sources) == [1, 2, 3]
+        first_ids = [n.node.metadata["id"] for n in first]
+        second_ids = [n.node.metadata["id"] for n in second]
+        assert first_ids[:2] == [1, 2] and sorted(first_ids[2:]) == [3, 101, 102]
+        assert second_ids[:2] == [2, 3] and sorted(second_ids[2:]) == [4, 102, 103]
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_pending_traversals(self, monkeypatch):
+        """Test that aclose() dispatches queued traversals and waits for them."""
+        def handler(request):
+            source = json.loads(request.content)["source"]
+            return httpx.Response(200, json={"results": [{"target_id": source + 100}]})
+
+        use_transport(monkeypatch, handler)
+        retriever = GraphRetriever(
+            index=make_index([1]), collection_name="docs", dispatch_timeout_ms=1000
+        )
+        pending = asyncio.ensure_future(retriever._traverse_graph(1))
+        await asyncio.sleep(0)
+        dispatcher = retriever._dispatcher
+
+        await retriever.aclose()
+
+        assert pending.done()
+        assert pending.result().tolist() == [101]
+        assert dispatcher._tasks == set()
+        assert retriever._dispatcher is None
+
+    def test_sync_client_reused_across_threads_and_closed(self, graph_server):
+        """Test that retrieve() off the main thread reuses one client until close()."""
+        url, sources = graph_server
+        index = make_index([1, 2], neighbor_ids={101, 102})
+        retriever = GraphRetriever(index=index, collection_name="docs", server_url=url)
+        clients, executors, results = [], [], []
+
+        def worker():
+            for _ in range(3):
+                results.append(retriever.retrieve("query"))
+                clients.append(retriever._client)
+                executors.append(retriever._executor)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert [len(nodes) for nodes in results] == [4, 4, 4]
+        assert sorted(sources) == [1, 1, 1, 2, 2, 2]
+        assert all(client is clients[0] for client in clients)
+        assert all(executor is executors[0] for executor in executors)
+        retriever.close()
+        assert clients[0].is_closed
+        assert executors[0]._shutdown
+        assert retriever._client is None
+        assert retriever._executor is None
+
+    @pytest.mark.asyncio
+    async def test_async_client_closed_after_retrieval(self, graph_server, monkeypatch):
+        """Test that aretrieve() closes its client once no request is in flight."""
+        url, sources = graph_server
+        index = make_index([1, 2], neighbor_ids={101, 102})
+        retriever = GraphRetriever(index=index, collection_name="docs", server_url=url)
+        created = []
+        original = httpx.AsyncClient
+
+        def track(**kwargs):
+            created.append(original(**kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(httpx, "AsyncClient", track)
+        nodes = await retriever.aretrieve("query")
+        await retriever.aclose()
+
+        assert len(nodes) == 4
+        assert sorted(sources) == [1, 2]
+        assert len(created) == 1 and created[0].is_closed
+        assert retriever._aclients == {}
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_held_async_client(self, graph_server):
+        """Test that aclose() closes an async client still held by a request."""
+        url, _ = graph_server
+        retriever = GraphRetriever(index=make_index([1]), collection_name="docs", server_url=url)
+
+        async with retriever._async_client() as client:
+            await retriever.aclose()
+            assert client.is_closed
+            assert retriever._aclients == {}
+
+    def test_negative_dispatch_window_rejected(self):
+        """Test that a negative dispatch window is rejected."""
+        with pytest.raises(SecurityError):
+            GraphRetriever(index=make_index([1]), collection_name="docs", dispatch_timeout_ms=-1)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"server_url": "ftp://localhost"},
+            {"server_url": "http://localhost\r\nHost: evil"},
+            {"seed_k": 0},
+            {"expand_k": "10"},
+            {"timeout_ms": 60_000},
+            {"dispatch_timeout_ms": "5"},
+            {"dispatch_timeout_ms": 2.5},
+            {"dispatch_timeout_ms": True},
+            {"dispatch_timeout_ms": 60_000},
+        ],
+    )
+    def test_invalid_arguments_rejected(self, kwargs):
+        """Test that invalid constructor arguments are rejected."""
+        with pytest.raises(SecurityError):
+            GraphRetriever(index=make_index([1]), collection_name="docs", **kwargs)
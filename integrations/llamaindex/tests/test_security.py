@@ -0,0 +1,43 @@
+"""Tests for VelesDB LlamaIndex input validation."""
+
+import pytest
+
+from llamaindex_velesdb.security import SecurityError, validate_text
+
+NON_STR_TEXT = [None, 42, ["text"], b"hello", memoryview(b"hello"), bytearray(b"hello")]
+
+
+class TestValidateText:
+    """Tests for validate_text."""
+
+    def test_str_returned_unchanged(self):
+        """Test that a string within the limit is returned as is."""
+        text = "hello"
+        assert validate_text(text, max_length=5) is text
+
+    def test_str_length_checked(self):
+        """Test that a string over the limit is rejected."""
+        with pytest.raises(SecurityError, match="maximum length of 4"):
+            validate_text("hello", max_length=4)
+
+    @pytest.mark.parametrize("value", NON_STR_TEXT)
+    def test_non_str_rejected(self, value):
+        """Test that anything but str is rejected, including bytes-like input."""
+        with pytest.raises(SecurityError, match="must be a string"):
+            validate_text(value)
+
+
+class TestTextQueryValidation:
+    """Tests that text entry points of the store reject non-str queries."""
+
+    @pytest.mark.parametrize("value", [b"hello", memoryview(b"hello")])
+    def test_text_query_rejects_bytes_like(self, store_factory, value):
+        """Test that text_query raises SecurityError for bytes-like input."""
+        with pytest.raises(SecurityError):
+            store_factory().text_query(value)
+
+    @pytest.mark.parametrize("value", [b"hello", memoryview(b"hello")])
+    def test_hybrid_query_rejects_bytes_like(self, store_factory, value):
+        """Test that hybrid_query raises SecurityError for bytes-like input."""
+        with pytest.raises(SecurityError):
+            store_factory().hybrid_query(value, [0.1] * 4)
@@ -1,33 +1,38 @@
 """Tests for VelesDB LlamaIndex VectorStore."""
 
-import tempfile
-import shutil
 from pathlib import Path
 
+import numpy as np
 import pytest
 from llama_index.core.schema import TextNode
 
 from llamaindex_velesdb import VelesDBVectorStore
 
 
+_ZERO_TAIL = [0.0] * 768
+
+
+def _sparse_emb(*vals):
+    """768-d embedding: ``vals`` followed by zeros.
+
+    Returned as a list because TextNode and VectorStoreQuery validate lists
+    much faster than arrays; the zero tail is shared, not rebuilt.
+    """
+    return [*vals, *_ZERO_TAIL[len(vals):]]
+
+
 class TestVelesDBVectorStore:
     """Test suite for VelesDBVectorStore."""
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for tests."""
-        path = tempfile.mkdtemp()
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
+        return str(tmp_path)
 
     @pytest.fixture
-    def vector_store(self, temp_dir):
+    def vector_store(self, store_factory):
         """Create a VelesDBVectorStore instance."""
-        return VelesDBVectorStore(
-            path=temp_dir,
-            collection_name="test",
-            metric="cosine",
-        )
+        return store_factory(collection_name="test", metric="cosine")
 
     def test_init(self, temp_dir):
         """Test VectorStore initialization."""
@@ -74,19 +79,19 @@ class TestVelesDBVectorStore:
             TextNode(
                 text="VelesDB is a vector database",
                 id_="doc1",
-                embedding=[0.1, 0.2, 0.3] + [0.0] * 765,
+                embedding=_sparse_emb(0.1, 0.2, 0.3),
             ),
             TextNode(
                 text="LlamaIndex is a RAG framework",
                 id_="doc2",
-                embedding=[0.4, 0.5, 0.6] + [0.0] * 765,
+                embedding=_sparse_emb(0.4, 0.5, 0.6),
             ),
         ]
         vector_store.add(nodes)
 
         # Query
         query = VectorStoreQuery(
-            query_embedding=[0.1, 0.2, 0.3] + [0.0] * 765,
+            query_embedding=_sparse_emb(0.1, 0.2, 0.3),
             similarity_top_k=2,
         )
         result = vector_store.query(query)
@@ -95,6 +100,23 @@ class TestVelesDBVectorStore:
         assert len(result.similarities) == len(result.nodes)
         assert len(result.ids) == len(result.nodes)
 
+    def test_query_ids_scores(self, vector_store):
+        """Test the lean query returning only IDs and scores."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        vector_store.add([
+            TextNode(text="Near", id_="near", embedding=[1.0, 0.0, 0.0, 0.0]),
+            TextNode(text="Far", id_="far", embedding=[0.0, 1.0, 0.0, 0.0]),
+        ])
+        query = VectorStoreQuery(query_embedding=[1.0, 0.1, 0.0, 0.0], similarity_top_k=2)
+
+        ids, scores = vector_store.query_ids_scores(query)
+        expected = vector_store.query(query)
+
+        assert ids.tolist() == expected.ids
+        assert scores.dtype == np.float32
+        np.testing.assert_allclose(scores, expected.similarities, rtol=1e-5)
+
     def test_query_empty_embedding(self, vector_store):
         """Test query with no embedding returns empty."""
         from llama_index.core.vector_stores.types import VectorStoreQuery
@@ -106,6 +128,22 @@ class TestVelesDBVectorStore:
         assert result.similarities == []
         assert result.ids == []
 
+    def test_query_with_score_threshold(self, vector_store):
+        """Test that hits below the score threshold are dropped."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        vector_store.add([
+            TextNode(text="Near", id_="near", embedding=[1.0, 0.0, 0.0, 0.0]),
+            TextNode(text="Far", id_="far", embedding=[0.0, 1.0, 0.0, 0.0]),
+        ])
+        query = VectorStoreQuery(query_embedding=[1.0, 0.1, 0.0, 0.0], similarity_top_k=2)
+
+        result = vector_store.query_with_score_threshold(query, score_threshold=0.5)
+
+        assert result.ids == ["near"]
+        assert np.all(np.asarray(result.similarities, dtype=np.float32) >= 0.5)
+        assert len(vector_store.query(query).ids) == 2
+
     def test_delete(self, vector_store):
         """Test deleting a node."""
         nodes = [
@@ -129,38 +167,34 @@ class TestVelesDBVectorStore:
 class TestVelesDBVectorStoreAdvanced:
     """Tests for advanced features (hybrid, text search)."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests."""
-        path = tempfile.mkdtemp()
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
+    # Shared, read-only query vectors (768-d, matching the populated store)
+    QUERY_A = np.zeros(768, dtype=np.float32)
+    QUERY_A[:3] = (0.1, 0.2, 0.3)
+    QUERY_A.setflags(write=False)
+    QUERY_B = np.full(768, 0.5, dtype=np.float32)
+    QUERY_B.setflags(write=False)
 
     @pytest.fixture
-    def populated_store(self, temp_dir):
+    def populated_store(self, store_factory):
         """Create a VelesDBVectorStore with sample data."""
-        store = VelesDBVectorStore(
-            path=temp_dir,
-            collection_name="test_advanced",
-            metric="cosine",
-        )
+        store = store_factory(collection_name="test_advanced", metric="cosine")
         nodes = [
             TextNode(
                 text="VelesDB is a high-performance vector database",
                 id_="doc1",
-                embedding=[0.1, 0.2, 0.3] + [0.0] * 765,
+                embedding=_sparse_emb(0.1, 0.2, 0.3),
                 metadata={"category": "database"},
             ),
             TextNode(
                 text="Python is a programming language for AI",
                 id_="doc2",
-                embedding=[0.4, 0.5, 0.6] + [0.0] * 765,
+                embedding=_sparse_emb(0.4, 0.5, 0.6),
                 metadata={"category": "language"},
             ),
             TextNode(
                 text="Machine learning uses vector embeddings",
                 id_="doc3",
-                embedding=[0.7, 0.8, 0.9] + [0.0] * 765,
+                embedding=_sparse_emb(0.7, 0.8, 0.9),
                 metadata={"category": "ai"},
             ),
         ]
@@ -169,11 +203,9 @@ class TestVelesDBVectorStoreAdvanced:
 
     def test_hybrid_query(self, populated_store):
         """Test hybrid search combining vector and BM25."""
-        query_embedding = [0.1, 0.2, 0.3] + [0.0] * 765
-
         result = populated_store.hybrid_query(
             query_str="vector database performance",
-            query_embedding=query_embedding,
+            query_embedding=self.QUERY_A,
             similarity_top_k=2,
             vector_weight=0.7,
         )
@@ -188,11 +220,9 @@ class TestVelesDBVectorStoreAdvanced:
 
     def test_hybrid_query_balanced_weights(self, populated_store):
         """Test hybrid search with equal vector and text weights."""
-        query_embedding = [0.5] * 768
-
         result = populated_store.hybrid_query(
             query_str="machine learning",
-            query_embedding=query_embedding,
+            query_embedding=self.QUERY_B,
             similarity_top_k=3,
             vector_weight=0.5,  # Equal weighting
         )
@@ -211,14 +241,11 @@ class TestVelesDBVectorStoreAdvanced:
         assert hasattr(result, 'nodes')
         assert len(result.nodes) <= 2
         for node in result.nodes:
-            assert isinstance(node, TextNode)
+            assert type(node) is TextNode
 
-    def test_text_query_empty_collection(self, temp_dir):
+    def test_text_query_empty_collection(self, store_factory):
         """Test text query on empty collection returns empty."""
-        store = VelesDBVectorStore(
-            path=temp_dir,
-            collection_name="empty_test",
-        )
+        store = store_factory(collection_name="empty_test")
 
         # Should return empty result, not raise
         result = store.text_query("query", similarity_top_k=5)
@@ -242,17 +269,15 @@ class TestVelesDBVectorStoreBatch:
     """Tests for batch operations and additional features."""
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for tests."""
-        path = tempfile.mkdtemp()
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
+        return str(tmp_path)
 
-    def test_batch_query(self, temp_dir):
+    def test_batch_query(self, store_factory):
         """Test batch query with multiple embeddings."""
         from llama_index.core.vector_stores.types import VectorStoreQuery
 
-        store = VelesDBVectorStore(path=temp_dir, collection_name="batch_test")
+        store = store_factory(collection_name="batch_test")
         
         nodes = [
             TextNode(text="VelesDB database", id_="doc1", embedding=[0.1] * 768),
@@ -274,26 +299,123 @@ class TestVelesDBVectorStoreBatch:
             assert hasattr(result, 'nodes')
             assert len(result.nodes) <= 2
 
-    def test_add_bulk(self, temp_dir):
+    def test_batch_query_matrix(self, store_factory):
+        """Test that a query matrix matches the per-query batch API."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        store = store_factory(collection_name="batch_matrix")
+        store.add([
+            TextNode(text=f"Doc {i}", id_=f"doc{i}", embedding=[float(i + 1), 1.0, 0.0, 0.0])
+            for i in range(5)
+        ])
+        matrix = np.array([[1.0, 1.0, 0.0, 0.0], [4.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+
+        results = store.batch_query_matrix(matrix, similarity_top_k=2)
+        expected = store.batch_query(
+            [VectorStoreQuery(query_embedding=row, similarity_top_k=2) for row in matrix]
+        )
+
+        assert [r.ids for r in results] == [r.ids for r in expected]
+        assert store.batch_query_matrix(np.empty((0, 4), dtype=np.float32)) == []
+
+    def test_batch_query_parallel_hydrate(self, store_factory):
+        """Test that thread-pool hydration matches sequential hydration."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        store = store_factory(collection_name="batch_parallel")
+        store.add([
+            TextNode(text=f"Doc {i}", id_=f"doc{i}", embedding=[float(i + 1), 1.0, 0.0, 0.0])
+            for i in range(5)
+        ])
+        queries = [
+            VectorStoreQuery(query_embedding=[float(i + 1), 1.0, 0.0, 0.0], similarity_top_k=3)
+            for i in range(10)
+        ]
+
+        sequential = store.batch_query(queries, parallel_hydrate=False)
+        parallel = store.batch_query(queries, parallel_hydrate=True)
+
+        assert [r.ids for r in parallel] == [r.ids for r in sequential]
+
+    def test_batch_query_dedups_identical_queries(self, store_factory):
+        """Test that repeated queries are searched once and stay aligned."""
+        from unittest.mock import MagicMock
+
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        store = store_factory(collection_name="batch_dedup")
+        store.add([
+            TextNode(text="A", id_="a", embedding=[1.0, 0.0, 0.0, 0.0]),
+            TextNode(text="B", id_="b", embedding=[0.0, 1.0, 0.0, 0.0]),
+        ])
+        store._collection = MagicMock(wraps=store._collection)
+        queries = [
+            VectorStoreQuery(query_embedding=[1.0, 0.0, 0.0, 0.0], similarity_top_k=1),
+            VectorStoreQuery(query_embedding=None),
+            VectorStoreQuery(query_embedding=[0.0, 1.0, 0.0, 0.0], similarity_top_k=1),
+            VectorStoreQuery(query_embedding=[1.0, 0.0, 0.0, 0.0], similarity_top_k=1),
+        ]
+
+        results = store.batch_query(queries)
+
+        assert len(store._collection.batch_search.call_args.args[0]) == 2
+        assert [r.ids for r in results] == [["a"], [], ["b"], ["a"]]
+        assert results[0] is not results[3]
+        assert results[0].nodes[0] is not results[3].nodes[0]
+
+    def test_add_bulk(self, store_factory):
         """Test bulk insert for large batches."""
-        store = VelesDBVectorStore(path=temp_dir, collection_name="bulk_test")
+        store = store_factory(collection_name="bulk_test")
 
+        # Rows of one matrix; construct skips validating 100 x 768 floats
+        # (pydantic v1 bridges in older llama-index-core only have construct)
+        construct = getattr(TextNode, "model_construct", None) or TextNode.construct
+        embeddings = np.repeat(np.arange(100, dtype=np.float32)[:, None] / 100, 768, axis=1)
         nodes = [
-            TextNode(
+            construct(
                 text=f"Document {i}",
                 id_=f"doc{i}",
-                embedding=[float(i) / 100] * 768,
+                embedding=embeddings[i],
             )
             for i in range(100)
         ]
 
         ids = store.add_bulk(nodes)
 
-        assert len(ids) == 100
+        assert ids == [f"doc{i}" for i in range(100)]
 
-    def test_get_nodes(self, temp_dir):
+    def test_add_bulk_chunks_upserts(self, store_factory):
+        """Test that bulk insert streams nodes in fixed-size chunks."""
+        from unittest.mock import MagicMock
+
+        store = store_factory(collection_name="bulk_chunks")
+        store._collection = MagicMock()
+        store._dimension = 4
+
+        nodes = [
+            TextNode(text=f"Document {i}", id_=f"doc{i}", embedding=[float(i)] * 4)
+            for i in range(20)
+        ]
+
+        ids = store.add_bulk(nodes, batch_size=8)
+
+        assert ids == [f"doc{i}" for i in range(20)]
+        chunk_sizes = [len(c.args[0]) for c in store._collection.upsert_bulk.call_args_list]
+        assert chunk_sizes == [8, 8, 4]
+
+    def test_add_bulk_skips_nodes_without_embedding(self, store_factory):
+        """Test that nodes lacking an embedding are skipped, not fatal."""
+        store = store_factory(collection_name="bulk_skip")
+        nodes = [
+            TextNode(text="Has vector", id_="with", embedding=[0.1] * 4),
+            TextNode(text="No vector", id_="without"),
+        ]
+
+        assert store.add_bulk(nodes) == ["with"]
+
+    def test_get_nodes(self, store_factory):
         """Test retrieving nodes by ID."""
-        store = VelesDBVectorStore(path=temp_dir, collection_name="get_test")
+        store = store_factory(collection_name="get_test")
 
         nodes = [
             TextNode(text="Doc A", id_="a", embedding=[0.1] * 768),
@@ -305,11 +427,30 @@ class TestVelesDBVectorStoreBatch:
 
         assert len(retrieved) == 2
         for node in retrieved:
-            assert isinstance(node, TextNode)
+            assert type(node) is TextNode
 
-    def test_collection_info(self, temp_dir):
-        """Test getting collection info."""
-        store = VelesDBVectorStore(path=temp_dir, collection_name="info_test")
+    def test_metadata_round_trip(self, store_factory):
+        """Test scalar metadata comes back unchanged and other values are dropped."""
+        store = store_factory(collection_name="metadata_test")
+        metadata = {"category": "tech", "année": "2024", "views": 42, "score": 0.5, "draft": False}
+
+        store.add([
+            TextNode(
+                text="Doc",
+                id_="m",
+                embedding=[0.1] * 768,
+                metadata={**metadata, "tags": ["a", "b"], "extra": {"k": 1}},
+            )
+        ])
+
+        (node,) = store.get_nodes(["m"])
+
+        assert node.text == "Doc"
+        assert node.metadata == metadata
+
+    def test_info_flush_is_empty(self, store_factory):
+        """Test collection info, flushing and emptiness on one store."""
+        store = store_factory(collection_name="info_test")
         
         nodes = [TextNode(text="Test", id_="t", embedding=[0.1] * 768)]
         store.add(nodes)
@@ -320,28 +461,81 @@ class TestVelesDBVectorStoreBatch:
         assert "name" in info
         assert "dimension" in info
 
-    def test_flush(self, temp_dir):
-        """Test flushing to disk."""
-        store = VelesDBVectorStore(path=temp_dir, collection_name="flush_test")
-        
-        nodes = [TextNode(text="Test", id_="t", embedding=[0.1] * 768)]
-        store.add(nodes)
-
         # Should not raise
         store.flush()
 
-    def test_is_empty(self, temp_dir):
-        """Test checking if empty."""
-        store = VelesDBVectorStore(path=temp_dir, collection_name="empty_test")
-        
-        nodes = [TextNode(text="Test", id_="t", embedding=[0.1] * 768)]
-        store.add(nodes)
-
         assert store.is_empty() is False
 
-    def test_velesql_query(self, temp_dir):
+    def test_collection_info_cached_until_write(self, store_factory):
+        """Test that info is reused between calls and refreshed by writes."""
+        from unittest.mock import MagicMock
+
+        store = store_factory(collection_name="info_cache_test")
+        store.add([TextNode(text="One", id_="one", embedding=[0.1] * 8)])
+        assert store.get_collection_info()["point_count"] == 1
+
+        store._collection = MagicMock(wraps=store._collection)
+        store.get_collection_info()
+        store.get_collection_info()
+        assert store._collection.info.call_count == 0
+
+        store.add([TextNode(text="Two", id_="two", embedding=[0.2] * 8)])
+        assert store.get_collection_info()["point_count"] == 2
+
+    @pytest.mark.parametrize("storage_mode", ["sq8", "binary"])
+    def test_quantized_storage_mode(self, store_factory, storage_mode):
+        """Test that the storage mode reaches the created collection."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        store = store_factory(collection_name="quant_test", storage_mode=storage_mode)
+        store.add([TextNode(text="Test", id_="t", embedding=[0.1] * 16)])
+
+        assert store.get_collection_info()["storage_mode"] == storage_mode
+        result = store.query(VectorStoreQuery(query_embedding=[0.1] * 16, similarity_top_k=1))
+        assert result.ids == ["t"]
+
+    def test_normalize_embeddings_matches_cosine(self, temp_dir):
+        """Test that normalized dot-product search reproduces cosine scores."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        nodes = [
+            TextNode(text="A", id_="a", embedding=[3.0, 0.0, 0.0, 0.0]),
+            TextNode(text="B", id_="b", embedding=[0.6, 0.8, 0.0, 0.0]),
+        ]
+        query = VectorStoreQuery(query_embedding=[0.8, 0.6, 0.0, 0.0], similarity_top_k=2)
+        plain = VelesDBVectorStore(path=str(Path(temp_dir) / "plain"))
+        normalized = VelesDBVectorStore(
+            path=str(Path(temp_dir) / "unit"), normalize_embeddings=True
+        )
+        plain.add(nodes)
+        normalized.add(nodes)
+
+        expected = plain.query(query)
+        result = normalized.query(query)
+
+        assert normalized.get_collection_info()["metric"] == "dotproduct"
+        assert result.ids == expected.ids
+        np.testing.assert_allclose(result.similarities, expected.similarities, atol=1e-5)
+
+    def test_xxh3_id_hash_roundtrip(self, store_factory):
+        """Test that xxh3 IDs are used consistently for writes and reads."""
+        pytest.importorskip("xxhash")
+        store = store_factory(collection_name="xxh3_test", id_hash="xxh3")
+        store.add([TextNode(text=f"Doc {i}", id_=f"n{i}", embedding=[0.1 * (i + 1)] * 8)
+                   for i in range(3)])
+
+        assert [n.node_id for n in store.get_nodes(["n0", "n2"])] == ["n0", "n2"]
+        store.delete("n0")
+        assert [n.node_id for n in store.get_nodes(["n0", "n1"])] == ["n1"]
+
+    def test_unknown_id_hash_rejected(self, temp_dir):
+        """Test that an unknown id_hash scheme is rejected."""
+        with pytest.raises(ValueError):
+            VelesDBVectorStore(path=temp_dir, id_hash="md5")
+
+    def test_velesql_query(self, store_factory):
         """Test VelesQL query execution."""
-        store = VelesDBVectorStore(path=temp_dir, collection_name="velesql_test")
+        store = store_factory(collection_name="velesql_test")
         
         nodes = [
             TextNode(
@@ -358,139 +552,213 @@ class TestVelesDBVectorStoreBatch:
         assert hasattr(results, 'nodes')
 
 
-class TestMultiQuerySearch:
-    """Tests for multi_query_search functionality (EPIC-016 US-046)."""
+@pytest.fixture(scope="module")
+def multi_query_store(tmp_path_factory):
+    """One populated store shared by the multi-query tests."""
+    store = VelesDBVectorStore(
+        path=str(tmp_path_factory.mktemp("multi_query")),
+        collection_name="multi_query_test",
+        metric="cosine",
+    )
+    nodes = [
+        TextNode(text="Greece travel guide", id_="g1", embedding=[0.1] * 768),
+        TextNode(text="Athens vacation tips", id_="g2", embedding=[0.15] * 768),
+        TextNode(text="Python programming", id_="p1", embedding=[0.9] * 768),
+        TextNode(text="Machine learning basics", id_="ml1", embedding=[0.2] * 768),
+        TextNode(text="Deep learning tutorial", id_="ml2", embedding=[0.25] * 768),
+        TextNode(text="Cloud computing AWS", id_="c1", embedding=[0.3] * 768),
+        TextNode(text="Azure cloud services", id_="c2", embedding=[0.35] * 768),
+        TextNode(text="Database optimization", id_="db1", embedding=[0.4] * 768),
+        TextNode(text="SQL performance tuning", id_="db2", embedding=[0.45] * 768),
+        TextNode(text="API design patterns", id_="api1", embedding=[0.5] * 768),
+        TextNode(text="REST API best practices", id_="api2", embedding=[0.55] * 768),
+        TextNode(text="Graph databases", id_="gr1", embedding=[0.6] * 768),
+        TextNode(text="Vector search", id_="vs1", embedding=[-0.6] * 768),
+    ]
+    store.add(nodes)
+    return store
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests."""
-        path = tempfile.mkdtemp()
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
 
-    @pytest.fixture
-    def vector_store(self, temp_dir):
-        """Create a VelesDBVectorStore instance."""
-        return VelesDBVectorStore(
-            path=temp_dir,
-            collection_name="multi_query_test",
-            metric="cosine",
-        )
-
-    def test_multi_query_search_basic(self, vector_store):
-        """Test basic multi-query search with default RRF fusion."""
-        nodes = [
-            TextNode(text="Greece travel guide", id_="g1", embedding=[0.1] * 768),
-            TextNode(text="Athens vacation tips", id_="g2", embedding=[0.15] * 768),
-            TextNode(text="Python programming", id_="p1", embedding=[0.9] * 768),
-        ]
-        vector_store.add(nodes)
+class TestMultiQuerySearch:
+    """Tests for multi_query_search functionality (EPIC-016 US-046)."""
 
+    @pytest.mark.parametrize(
+        "fusion,fusion_params",
+        [
+            (None, None),
+            ("rrf", None),
+            ("weighted", {"avg_weight": 0.5, "max_weight": 0.3, "hit_weight": 0.2}),
+            ("average", None),
+            ("maximum", None),
+        ],
+    )
+    def test_multi_query_search_fusion(
+        self, multi_query_store, embedding_factory, fusion, fusion_params
+    ):
+        """Test multi-query search with each fusion strategy (None: default RRF)."""
         # Multi-query search with reformulations
-        query_embeddings = [
-            [0.1] * 768,  # Similar to Greece
-            [0.12] * 768,  # Similar to Athens
-        ]
-        result = vector_store.multi_query_search(
+        query_embeddings = [embedding_factory(0.2), embedding_factory(0.22)]
+        kwargs = {} if fusion is None else {"fusion": fusion, "fusion_params": fusion_params}
+
+        result = multi_query_store.multi_query_search(
             query_embeddings=query_embeddings,
             similarity_top_k=3,
+            **kwargs,
         )
 
         assert hasattr(result, 'nodes')
-        assert len(result.nodes) <= 3
+        assert 0 < len(result.nodes) <= 3
+        sims = np.asarray(result.similarities, dtype=np.float32)
+        assert np.all(np.diff(sims) <= 1e-6)
 
-    def test_multi_query_search_with_rrf(self, vector_store):
-        """Test multi-query search with explicit RRF fusion."""
-        nodes = [
-            TextNode(text="Machine learning basics", id_="ml1", embedding=[0.2] * 768),
-            TextNode(text="Deep learning tutorial", id_="ml2", embedding=[0.25] * 768),
-        ]
-        vector_store.add(nodes)
+    def test_multi_query_search_empty_queries(self, multi_query_store):
+        """Test multi-query search with empty queries list."""
+        result = multi_query_store.multi_query_search(
+            query_embeddings=[],
+            similarity_top_k=5,
+        )
 
-        query_embeddings = [
-            [0.2] * 768,
-            [0.22] * 768,
-        ]
-        result = vector_store.multi_query_search(
-            query_embeddings=query_embeddings,
-            similarity_top_k=2,
-            fusion="rrf",
+        assert len(result.nodes) == 0
+
+    def test_multi_query_search_accepts_matrix(self, multi_query_store):
+        """Test that a (Q, d) array gives the same result as a list of rows."""
+        query_embeddings = [[0.6] * 768, [0.62] * 768]
+        from_list = multi_query_store.multi_query_search(query_embeddings, similarity_top_k=2)
+        from_matrix = multi_query_store.multi_query_search(
+            np.array(query_embeddings, dtype=np.float32), similarity_top_k=2
         )
 
-        assert len(result.nodes) <= 2
+        assert from_matrix.ids == from_list.ids
+        assert multi_query_store.multi_query_search(
+            np.empty((0, 768), dtype=np.float32)
+        ).nodes == []
 
-    def test_multi_query_search_with_weighted(self, vector_store):
-        """Test multi-query search with weighted fusion."""
-        nodes = [
-            TextNode(text="Cloud computing AWS", id_="c1", embedding=[0.3] * 768),
-            TextNode(text="Azure cloud services", id_="c2", embedding=[0.35] * 768),
-        ]
-        vector_store.add(nodes)
 
-        query_embeddings = [
-            [0.3] * 768,
-            [0.32] * 768,
-        ]
-        result = vector_store.multi_query_search(
-            query_embeddings=query_embeddings,
-            similarity_top_k=2,
-            fusion="weighted",
-            fusion_params={"avg_weight": 0.5, "max_weight": 0.3, "hit_weight": 0.2},
-        )
+class TestAsyncMethods:
+    """Tests for the async wrappers."""
 
-        assert len(result.nodes) <= 2
+    @pytest.mark.asyncio
+    async def test_async_add_and_query(self, store_factory):
+        """Test adding and querying through the async API."""
+        import asyncio
 
-    def test_multi_query_search_empty_queries(self, vector_store):
-        """Test multi-query search with empty queries list."""
-        nodes = [TextNode(text="Some document", id_="d1", embedding=[0.1] * 768)]
-        vector_store.add(nodes)
+        from llama_index.core.vector_stores.types import VectorStoreQuery
 
-        result = vector_store.multi_query_search(
-            query_embeddings=[],
-            similarity_top_k=5,
+        store = store_factory(collection_name="async_test")
+        ids = await store.async_add([
+            TextNode(text="A", id_="a", embedding=[1.0, 0.0, 0.0, 0.0]),
+            TextNode(text="B", id_="b", embedding=[0.0, 1.0, 0.0, 0.0]),
+        ])
+        assert ids == ["a", "b"]
+
+        first, second = await asyncio.gather(
+            store.aquery(VectorStoreQuery(query_embedding=[1.0, 0.0, 0.0, 0.0], similarity_top_k=1)),
+            store.aquery(VectorStoreQuery(query_embedding=[0.0, 1.0, 0.0, 0.0], similarity_top_k=1)),
         )
 
-        assert len(result.nodes) == 0
+        assert first.ids == ["a"]
+        assert second.ids == ["b"]
 
-    def test_multi_query_search_average_fusion(self, vector_store):
-        """Test multi-query search with average fusion strategy."""
-        nodes = [
-            TextNode(text="Database optimization", id_="db1", embedding=[0.4] * 768),
-            TextNode(text="SQL performance tuning", id_="db2", embedding=[0.45] * 768),
-        ]
-        vector_store.add(nodes)
+    @pytest.mark.asyncio
+    async def test_async_batch_query_and_get_nodes(self, store_factory):
+        """Test the async batch query and node lookup wrappers."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
 
-        query_embeddings = [
-            [0.4] * 768,
-            [0.42] * 768,
-        ]
-        result = vector_store.multi_query_search(
-            query_embeddings=query_embeddings,
-            similarity_top_k=2,
-            fusion="average",
-        )
+        store = store_factory(collection_name="async_batch")
+        await store.aadd_bulk([
+            TextNode(text=f"Doc {i}", id_=f"doc{i}", embedding=[float(i + 1), 1.0, 0.0, 0.0])
+            for i in range(3)
+        ])
 
-        assert len(result.nodes) <= 2
+        results = await store.abatch_query([
+            VectorStoreQuery(query_embedding=[1.0, 1.0, 0.0, 0.0], similarity_top_k=2),
+            VectorStoreQuery(query_embedding=[3.0, 1.0, 0.0, 0.0], similarity_top_k=2),
+        ])
+        nodes = await store.aget_nodes(["doc1"])
 
-    def test_multi_query_search_maximum_fusion(self, vector_store):
-        """Test multi-query search with maximum fusion strategy."""
-        nodes = [
-            TextNode(text="API design patterns", id_="api1", embedding=[0.5] * 768),
-            TextNode(text="REST API best practices", id_="api2", embedding=[0.55] * 768),
-        ]
-        vector_store.add(nodes)
+        assert len(results) == 2
+        assert [n.node_id for n in nodes] == ["doc1"]
 
-        query_embeddings = [
-            [0.5] * 768,
-            [0.52] * 768,
-        ]
-        result = vector_store.multi_query_search(
-            query_embeddings=query_embeddings,
-            similarity_top_k=2,
-            fusion="maximum",
-        )
 
-        assert len(result.nodes) <= 2
+class TestQueryCache:
+    """Tests for the optional query result cache."""
+
+    @pytest.fixture
+    def cached_store(self, store_factory):
+        """Create a store with the query cache enabled."""
+        store = store_factory(collection_name="cache_test", query_cache_size=8)
+        store.add([
+            TextNode(text="Doc A", id_="a", embedding=[0.1, 0.2, 0.3, 0.4]),
+            TextNode(text="Doc B", id_="b", embedding=[0.4, 0.3, 0.2, 0.1]),
+        ])
+        return store
+
+    def test_repeated_query_hits_cache(self, cached_store):
+        """Test that an identical query returns the cached result."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        query = VectorStoreQuery(query_embedding=[0.1, 0.2, 0.3, 0.4], similarity_top_k=2)
+
+        first = cached_store.query(query)
+        second = cached_store.query(query)
+
+        assert second.ids == first.ids
+        assert second.similarities == first.similarities
+        stats = cached_store.get_collection_info()["query_cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_cache_hit_isolated_from_caller_edits(self, cached_store):
+        """Test that editing a returned result does not change later hits."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        query = VectorStoreQuery(query_embedding=[0.1, 0.2, 0.3, 0.4], similarity_top_k=2)
+
+        first = cached_store.query(query)
+        first.nodes[0].metadata["graph_depth"] = 0
+        second = cached_store.query(query)
+        second.nodes[0].metadata["retrieval_mode"] = "graph_expanded"
+        third = cached_store.query(query)
+
+        assert second.nodes[0] is not first.nodes[0]
+        assert "graph_depth" not in second.nodes[0].metadata
+        assert "retrieval_mode" not in third.nodes[0].metadata
+        assert third.ids == first.ids
+
+    def test_write_invalidates_cache(self, cached_store):
+        """Test that adding nodes clears cached results."""
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+
+        query = VectorStoreQuery(query_embedding=[0.1, 0.2, 0.3, 0.4], similarity_top_k=5)
+        first = cached_store.query(query)
+
+        cached_store.add([TextNode(text="Doc C", id_="c", embedding=[0.1, 0.2, 0.3, 0.5])])
+        second = cached_store.query(query)
+
+        assert second is not first
+        assert len(second.nodes) == len(first.nodes) + 1
+
+    def test_equivalent_text_queries_share_entry(self, cached_store):
+        """Test that text queries with the same BM25 terms share a cache entry."""
+        first = cached_store.text_query("Doc A", similarity_top_k=2)
+        second = cached_store.text_query("  doc, a!!", similarity_top_k=2)
+
+        assert second.ids == first.ids
+        assert second.similarities == first.similarities
+        assert cached_store.get_collection_info()["query_cache"]["hits"] == 1
+
+    def test_text_query_without_terms_skips_search(self, cached_store):
+        """Test that a query with no searchable terms returns empty."""
+        result = cached_store.text_query("a ! ?", similarity_top_k=2)
+
+        assert result.ids == []
+        assert cached_store.get_collection_info()["query_cache"]["misses"] == 0
+
+    def test_cache_disabled_by_default(self, store_factory):
+        """Test that no cache statistics are reported by default."""
+        store = store_factory(collection_name="no_cache")
+
+        assert "query_cache" not in store.get_collection_info()
 
 
 if __name__ == "__main__":
@@ -5,9 +5,7 @@ EPIC-016 US-053: VelesQL v2.0 - Filtres LlamaIndex
 Run with: pytest tests/test_velesql_v2.py -v
 """
 
-import tempfile
-import shutil
-
+import numpy as np
 import pytest
 from llama_index.core.schema import TextNode
 from llama_index.core.vector_stores.types import VectorStoreQuery, MetadataFilters, MetadataFilter
@@ -15,15 +13,42 @@ from llama_index.core.vector_stores.types import VectorStoreQuery, MetadataFilte
 from llamaindex_velesdb import VelesDBVectorStore
 
 
+def _embedding(prefix, dtype=np.float32):
+    """768-d embedding starting with ``prefix``, cast to ``dtype``.
+
+    int8 values are scaled by 127 as a symmetric quantizer would.
+    """
+    vec = np.zeros(768, dtype=np.float32)
+    vec[:len(prefix)] = prefix
+    if dtype == np.int8:
+        return np.clip(np.rint(vec * 127), -128, 127).astype(np.int8)
+    return vec.astype(dtype)
+
+
+DTYPES = [np.float32, np.float16, np.int8]
+
+
 class TestVelesQLv2BasicSearch:
     """Tests for basic search functionality."""
 
+    DOCS = [
+        ("doc1", "AI document about machine learning", {"category": "ai", "level": "beginner"}),
+        ("doc2", "Another AI document", {"category": "ai", "level": "advanced"}),
+        ("doc3", "Data science basics", {"category": "data", "level": "beginner"}),
+    ]
+    EMBEDDINGS = np.stack([
+        _embedding([0.1, 0.2, 0.3]),
+        _embedding([0.15, 0.25, 0.35]),
+        _embedding([0.2, 0.3, 0.4]),
+    ])
+    # Normalized once for the exact-search oracle
+    UNIT_EMBEDDINGS = EMBEDDINGS / np.linalg.norm(EMBEDDINGS, axis=1, keepdims=True)
+    DOC_IDS = np.array([node_id for node_id, _, _ in DOCS])
+
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for tests."""
-        path = tempfile.mkdtemp(prefix="velesdb_llamaindex_v2_")
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
+        return str(tmp_path)
 
     @pytest.fixture
     def vector_store(self, temp_dir):
@@ -35,61 +60,61 @@ class TestVelesQLv2BasicSearch:
         )
         # Add test nodes
         nodes = [
-            TextNode(
-                text="AI document about machine learning",
-                id_="doc1",
-                embedding=[0.1, 0.2, 0.3] + [0.0] * 765,
-                metadata={"category": "ai", "level": "beginner"},
-            ),
-            TextNode(
-                text="Another AI document",
-                id_="doc2",
-                embedding=[0.15, 0.25, 0.35] + [0.0] * 765,
-                metadata={"category": "ai", "level": "advanced"},
-            ),
-            TextNode(
-                text="Data science basics",
-                id_="doc3",
-                embedding=[0.2, 0.3, 0.4] + [0.0] * 765,
-                metadata={"category": "data", "level": "beginner"},
-            ),
+            TextNode(text=text, id_=node_id, embedding=vec, metadata=metadata)
+            for (node_id, text, metadata), vec in zip(self.DOCS, self.EMBEDDINGS.tolist())
         ]
         store.add(nodes)
         return store
 
-    def test_basic_query(self, vector_store):
-        """Test basic vector search."""
+    @pytest.fixture
+    def ground_truth(self):
+        """Exact cosine top-k over the test nodes, from one matmul."""
+        def top_k(query, k):
+            q = np.asarray(query, dtype=np.float32)
+            scores = self.UNIT_EMBEDDINGS @ (q / np.linalg.norm(q))
+            order = np.argsort(-scores, kind="stable")[:k]
+            return self.DOC_IDS[order].tolist(), scores[order]
+
+        return top_k
+
+    @pytest.mark.parametrize("dtype", DTYPES)
+    def test_basic_query(self, vector_store, dtype):
+        """Test basic vector search with float32, float16 and int8 queries."""
         query = VectorStoreQuery(
-            query_embedding=[0.1, 0.2, 0.3] + [0.0] * 765,
+            query_embedding=_embedding([0.1, 0.2, 0.3], dtype),
             similarity_top_k=2,
         )
         result = vector_store.query(query)
         
         assert result.nodes is not None
         assert len(result.nodes) <= 2
+        assert result.ids[0] == "doc1"
 
-    def test_query_with_similarity_scores(self, vector_store):
+    def test_query_with_similarity_scores(self, vector_store, ground_truth):
         """Test that query returns similarity scores."""
         query = VectorStoreQuery(
-            query_embedding=[0.1, 0.2, 0.3] + [0.0] * 765,
+            query_embedding=_embedding([0.1, 0.2, 0.3]),
             similarity_top_k=3,
         )
         result = vector_store.query(query)
         
         assert result.similarities is not None
         # Scores should be in descending order (higher is better for cosine)
-        if len(result.similarities) > 1:
-            assert result.similarities[0] >= result.similarities[-1]
+        sims = np.asarray(result.similarities, dtype=np.float32)
+        assert np.all(np.diff(sims) <= 1e-6)
+
+        # Ranking and scores match exact cosine search
+        expected_ids, expected_scores = ground_truth(query.query_embedding, 3)
+        assert result.ids == expected_ids
+        np.testing.assert_allclose(sims, expected_scores, atol=1e-4)
 
 
 class TestVelesQLv2Filters:
     """Tests for filter functionality."""
 
     @pytest.fixture
-    def temp_dir(self):
-        path = tempfile.mkdtemp(prefix="velesdb_llamaindex_filter_")
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
+    def temp_dir(self, tmp_path):
+        return str(tmp_path)
 
     @pytest.fixture
     def vector_store(self, temp_dir):
@@ -142,13 +167,12 @@ class TestVelesQLv2Integration:
     """Integration tests for complete workflows."""
 
     @pytest.fixture
-    def temp_dir(self):
-        path = tempfile.mkdtemp(prefix="velesdb_llamaindex_int_")
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
+    def temp_dir(self, tmp_path):
+        return str(tmp_path)
 
-    def test_add_and_query_workflow(self, temp_dir):
-        """Test complete add and query workflow."""
+    @pytest.mark.parametrize("dtype", DTYPES)
+    def test_add_and_query_workflow(self, temp_dir, dtype):
+        """Test complete add and query workflow with each embedding dtype."""
         store = VelesDBVectorStore(
             path=temp_dir,
             collection_name="workflow",
@@ -160,13 +184,13 @@ class TestVelesQLv2Integration:
             TextNode(
                 text="Document about AI",
                 id_="ai1",
-                embedding=[0.1, 0.2] + [0.0] * 766,
+                embedding=_embedding([0.1, 0.2], dtype),
                 metadata={"topic": "ai"},
             ),
             TextNode(
                 text="Document about ML",
                 id_="ml1",
-                embedding=[0.15, 0.25] + [0.0] * 766,
+                embedding=_embedding([0.15, 0.25], dtype),
                 metadata={"topic": "ml"},
             ),
         ]
@@ -175,11 +199,12 @@ class TestVelesQLv2Integration:
 
         # Query
         query = VectorStoreQuery(
-            query_embedding=[0.1, 0.2] + [0.0] * 766,
+            query_embedding=_embedding([0.1, 0.2], dtype),
             similarity_top_k=2,
         )
         result = store.query(query)
         assert len(result.nodes) == 2
+        assert result.ids[0] == "ai1"
 
     def test_delete_nodes(self, temp_dir):
         """Test deleting nodes from store."""
@@ -208,18 +233,15 @@ class TestVelesQLv2Integration:
         )
         result = store.query(query)
         # Node should be deleted
-        node_ids = [n.node_id for n in result.nodes] if result.nodes else []
-        assert "del1" not in node_ids
+        assert "del1" not in (result.ids or [])
 
 
 class TestVelesQLv2Documentation:
     """Tests to verify documented features work."""
 
     @pytest.fixture
-    def temp_dir(self):
-        path = tempfile.mkdtemp(prefix="velesdb_llamaindex_doc_")
-        yield path
-        shutil.rmtree(path, ignore_errors=True)
+    def temp_dir(self, tmp_path):
+        return str(tmp_path)
 
     def test_readme_basic_usage(self, temp_dir):
         """Test basic usage from README."""
@@ -250,12 +272,12 @@ class TestVelesQLv2Documentation:
         store = VelesDBVectorStore(path=temp_dir)
         assert store.stores_text is True
 
-    def test_custom_metric(self, temp_dir):
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean", "dot"])
+    def test_custom_metric(self, temp_dir, metric):
         """Test creating store with different metrics."""
-        for metric in ["cosine", "euclidean", "dot"]:
-            store = VelesDBVectorStore(
-                path=temp_dir,
-                collection_name=f"metric_{metric}",
-                metric=metric,
-            )
-            assert store.metric == metric
+        store = VelesDBVectorStore(
+            path=temp_dir,
+            collection_name=f"metric_{metric}",
+            metric=metric,
+        )
+        assert store.metric == metric
@@ -4,10 +4,30 @@ VelesDB Recall vs Latency Visualization
 Generates publication-quality charts for benchmark results.
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
+# Matplotlib and NumPy are imported inside the chart functions, so other
+# scripts can import the benchmark tables without loading them.
 from dataclasses import dataclass
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Output resolution; figures are created at it so saving never resamples
+DPI = 150
+
+# Layout areas left free at the bottom of the figure for footer text, so
+# tight_layout keeps axis labels clear of it. Figures are saved at their
+# full size rather than re-rendered to find a tight bounding box.
+_FOOTER_RECT = (0, 0.03, 1, 1)
+_INSIGHT_RECT = (0, 0.06, 1, 1)
+
+# Fast PNG encoding: ~20% quicker saves for ~30% larger files
+_PNG_OPTIONS = {'compress_level': 1, 'optimize': False}
+
+# Shared text styles, built once rather than per label
+_ANNOT_BBOX = dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray', alpha=0.8)
+_BRANDING = 'VelesDB Core v1.1.0 - January 11, 2026'
+_BRANDING_STYLE = dict(fontsize=8, ha='right', va='bottom', alpha=0.5, style='italic')
 
 @dataclass
 class BenchmarkResult:
@@ -46,30 +66,67 @@ NATIVE_VS_HNSW_RS = [
     NativeVsHnswRsResult("Parallel Insert", 1470.0, 1570.0),  # in ms for consistency
 ]
 
-def create_recall_latency_chart(results: List[BenchmarkResult], title: str, filename: str):
+# Structured-array dtypes for the result tables; field names match the
+# dataclass attributes. Kept as plain specs so NumPy loads only on use.
+_RESULT_DTYPE = [('mode', 'U16'), ('ef_search', 'i4'),
+                 ('recall', 'f8'), ('latency_p50_ms', 'f8')]
+_NATIVE_DTYPE = [('operation', 'U32'), ('native_ms', 'f8'), ('hnsw_rs_ms', 'f8')]
+
+def _columns(rows: list, dtype: list):
+    """Return dataclass rows as a structured array, one typed column per field."""
+    import numpy as np
+
+    names = [name for name, _ in dtype]
+    return np.fromiter((tuple(getattr(row, name) for name in names) for row in rows),
+                       dtype=dtype, count=len(rows))
+
+def _prepare_figure(fig: Optional["Figure"], figsize: Tuple[float, float]) -> "Figure":
+    """Return ``fig`` cleared and resized, or a new Figure outside pyplot.
+
+    Figures are built with the object-oriented API so no pyplot figure
+    manager is created or torn down per chart; callers drawing several
+    charts in one process can pass the same Figure to each.
+    """
+    if fig is None:
+        # A bare Figure saves through its own canvas, so no pyplot backend
+        # is selected and a caller's pyplot state is left untouched.
+        from matplotlib.figure import Figure
+
+        return Figure(figsize=figsize, dpi=DPI)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.set_dpi(DPI)
+    return fig
+
+def create_recall_latency_chart(results: List[BenchmarkResult], title: str, filename: str,
+                                fig: Optional["Figure"] = None):
     """Create a recall vs latency chart with annotations."""
-    
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
-    recalls = [r.recall for r in results]
-    latencies = [r.latency_p50_ms for r in results]
-    modes = [r.mode for r in results]
-    ef_values = [r.ef_search for r in results]
-    
-    # Main curve
-    ax.plot(latencies, recalls, 'o-', linewidth=2.5, markersize=12, 
-            color='#2563eb', markerfacecolor='white', markeredgewidth=2.5)
-    
-    # Annotations for each point
+    from matplotlib.transforms import offset_copy
+    
+    fig = _prepare_figure(fig, (12, 8))
+    ax = fig.subplots()
+    
+    cols = _columns(results, _RESULT_DTYPE)
+    recalls = cols['recall']
+    latencies = cols['latency_p50_ms']
+    modes = cols['mode']
+    ef_values = cols['ef_search']
+    
+    # Main curve: one line plus one marker collection
+    ax.plot(latencies, recalls, '-', linewidth=2.5, color='#2563eb', rasterized=True)
+    ax.scatter(latencies, recalls, s=144, facecolors='white', edgecolors='#2563eb',
+               linewidths=2.5, zorder=3, rasterized=True)
+    
+    # Annotations for each point, alternating above and below the curve.
+    # Plain text artists share the two offset transforms and the bbox style.
+    offsets = (offset_copy(ax.transData, fig=fig, x=10, y=10, units='points'),
+               offset_copy(ax.transData, fig=fig, x=10, y=-15, units='points'))
     for i, (lat, rec, mode, ef) in enumerate(zip(latencies, recalls, modes, ef_values)):
-        offset = (10, 10) if i % 2 == 0 else (10, -15)
-        ax.annotate(f'{mode}\nef={ef}\n{rec:.1f}%', 
-                   (lat, rec), 
-                   textcoords="offset points",
-                   xytext=offset,
-                   fontsize=9,
-                   ha='left',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray', alpha=0.8))
+        ax.text(lat, rec, f'{mode}\nef={ef}\n{rec:.1f}%',
+                transform=offsets[i % 2],
+                fontsize=9,
+                ha='left',
+                bbox=_ANNOT_BBOX)
     
     # Target zones
     ax.axhline(y=95, color='green', linestyle='--', alpha=0.5, label='Production target (95%)')
@@ -81,41 +138,44 @@ def create_recall_latency_chart(results: List[BenchmarkResult], title: str, file
     ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
     
     ax.set_ylim(88, 101)
-    ax.set_xlim(0, max(latencies) * 1.5)
+    ax.set_xlim(0, latencies.max() * 1.5)
     
     ax.grid(True, alpha=0.3)
     ax.legend(loc='lower right', fontsize=10)
     
     # Add VelesDB branding
-    fig.text(0.99, 0.01, 'VelesDB Core v1.1.0 - January 11, 2026', fontsize=8, 
-             ha='right', va='bottom', alpha=0.5, style='italic')
+    fig.text(0.99, 0.01, _BRANDING, **_BRANDING_STYLE)
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.tight_layout(rect=_FOOTER_RECT)
+    fig.savefig(filename, dpi=DPI, facecolor='white',
+                pil_kwargs=_PNG_OPTIONS)
     print(f"✅ Chart saved: {filename}")
 
 def create_comparison_chart(results_10k: List[BenchmarkResult], 
                            results_100k: List[BenchmarkResult],
-                           filename: str):
+                           filename: str,
+                           fig: Optional["Figure"] = None):
     """Create a side-by-side comparison chart."""
+    from matplotlib.transforms import offset_copy
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+    fig = _prepare_figure(fig, (16, 7))
+    ax1, ax2 = fig.subplots(1, 2)
     
     for ax, results, title, color in [
         (ax1, results_10k, "10K vectors / 128D", '#2563eb'),
         (ax2, results_100k, "100K vectors / 768D", '#dc2626')
     ]:
-        recalls = [r.recall for r in results]
-        latencies = [r.latency_p50_ms for r in results]
-        modes = [r.mode for r in results]
+        cols = _columns(results, _RESULT_DTYPE)
+        recalls = cols['recall']
+        latencies = cols['latency_p50_ms']
+        modes = cols['mode']
         
         ax.plot(latencies, recalls, 'o-', linewidth=2.5, markersize=10, 
-                color=color, markerfacecolor='white', markeredgewidth=2)
+                color=color, markerfacecolor='white', markeredgewidth=2, rasterized=True)
         
+        label_offset = offset_copy(ax.transData, fig=fig, x=5, y=5, units='points')
         for lat, rec, mode in zip(latencies, recalls, modes):
-            ax.annotate(f'{mode}', (lat, rec), textcoords="offset points",
-                       xytext=(5, 5), fontsize=9)
+            ax.text(lat, rec, mode, transform=label_offset, fontsize=9)
         
         ax.axhline(y=95, color='green', linestyle='--', alpha=0.5)
         ax.set_xlabel('Latency P50 (ms)', fontsize=12, fontweight='bold')
@@ -125,32 +185,38 @@ def create_comparison_chart(results_10k: List[BenchmarkResult],
         ax.grid(True, alpha=0.3)
     
     fig.suptitle('VelesDB Core - Recall vs Latency Scaling', fontsize=16, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig(filename, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(filename, dpi=DPI, facecolor='white',
+                pil_kwargs=_PNG_OPTIONS)
     print(f"✅ Comparison chart saved: {filename}")
 
-def create_native_hnsw_comparison(results: List[NativeVsHnswRsResult], filename: str):
+def create_native_hnsw_comparison(results: List[NativeVsHnswRsResult], filename: str,
+                                  fig: Optional["Figure"] = None):
     """Create a bar chart comparing Native HNSW vs hnsw_rs."""
+    import numpy as np
     
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig = _prepare_figure(fig, (10, 7))
+    ax = fig.subplots()
     
-    operations = [r.operation for r in results]
-    native_times = [r.native_ms for r in results]
-    hnsw_rs_times = [r.hnsw_rs_ms for r in results]
+    cols = _columns(results, _NATIVE_DTYPE)
+    operations = cols['operation']
+    native_times = cols['native_ms']
+    hnsw_rs_times = cols['hnsw_rs_ms']
     
     x = np.arange(len(operations))
     width = 0.35
     
-    bars1 = ax.bar(x - width/2, native_times, width, label='Native HNSW', color='#2563eb')
-    bars2 = ax.bar(x + width/2, hnsw_rs_times, width, label='hnsw_rs', color='#dc2626')
+    bars1 = ax.bar(x - width/2, native_times, width, label='Native HNSW', color='#2563eb',
+                   rasterized=True)
+    bars2 = ax.bar(x + width/2, hnsw_rs_times, width, label='hnsw_rs', color='#dc2626',
+                   rasterized=True)
     
     # Add percentage improvement labels
-    for i, (native, hnsw) in enumerate(zip(native_times, hnsw_rs_times)):
-        improvement = ((hnsw - native) / hnsw) * 100
-        ax.annotate(f'{improvement:.0f}% faster', 
-                   xy=(x[i] - width/2, native + max(native_times) * 0.02),
-                   ha='center', fontsize=10, fontweight='bold', color='#16a34a')
+    improvements = (hnsw_rs_times - native_times) / hnsw_rs_times * 100
+    label_y = native_times + native_times.max() * 0.02
+    for xi, yi, improvement in zip(x - width/2, label_y, improvements):
+        ax.text(xi, yi, f'{improvement:.0f}% faster',
+                ha='center', fontsize=10, fontweight='bold', color='#16a34a')
     
     ax.set_ylabel('Time (ms)', fontsize=14, fontweight='bold')
     ax.set_title('VelesDB Native HNSW vs hnsw_rs\n(5K vectors, 128D, Euclidean)', 
@@ -161,53 +227,50 @@ def create_native_hnsw_comparison(results: List[NativeVsHnswRsResult], filename:
     ax.grid(True, alpha=0.3, axis='y')
     
     # Add value labels on bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}ms' if height < 100 else f'{height/1000:.2f}s',
-                   xy=(bar.get_x() + bar.get_width()/2, height),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=9)
-    
-    for bar in bars2:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}ms' if height < 100 else f'{height/1000:.2f}s',
-                   xy=(bar.get_x() + bar.get_width()/2, height),
-                   xytext=(0, 3), textcoords="offset points",
-                   ha='center', va='bottom', fontsize=9)
-    
-    fig.text(0.99, 0.01, 'VelesDB Core v1.1.0 - January 11, 2026', fontsize=8, 
-             ha='right', va='bottom', alpha=0.5, style='italic')
-    
-    plt.tight_layout()
-    plt.savefig(filename, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
+    for bars, times in ((bars1, native_times), (bars2, hnsw_rs_times)):
+        ax.bar_label(bars, labels=[f'{t:.1f}ms' if t < 100 else f'{t/1000:.2f}s' for t in times],
+                     padding=3, fontsize=9)
+    
+    fig.text(0.99, 0.01, _BRANDING, **_BRANDING_STYLE)
+    
+    fig.tight_layout(rect=_FOOTER_RECT)
+    fig.savefig(filename, dpi=DPI, facecolor='white',
+                pil_kwargs=_PNG_OPTIONS)
     print(f"✅ Native HNSW comparison chart saved: {filename}")
 
-def create_ef_scaling_chart(results: List[BenchmarkResult], filename: str):
+def create_ef_scaling_chart(results: List[BenchmarkResult], filename: str,
+                            fig: Optional["Figure"] = None):
     """Show how ef_search affects both recall and latency."""
+    import numpy as np
     
-    fig, ax1 = plt.subplots(figsize=(12, 7))
+    fig = _prepare_figure(fig, (12, 7))
+    ax1 = fig.subplots()
     
-    ef_values = [r.ef_search for r in results]
-    recalls = [r.recall for r in results]
-    latencies = [r.latency_p50_ms for r in results]
+    cols = _columns(results, _RESULT_DTYPE)
+    ef_values = cols['ef_search']
+    recalls = cols['recall']
+    latencies = cols['latency_p50_ms']
+    # ef_search is plotted on log2 positions computed once here, on a linear
+    # axis, rather than through a log scale transform on every draw
+    log_ef = np.log2(ef_values)
     
     # Recall curve (left y-axis)
     color1 = '#2563eb'
     ax1.set_xlabel('ef_search', fontsize=14, fontweight='bold')
     ax1.set_ylabel('Recall@10 (%)', fontsize=14, fontweight='bold', color=color1)
-    line1 = ax1.plot(ef_values, recalls, 'o-', linewidth=2.5, markersize=10, 
-                     color=color1, label='Recall@10')
+    line1 = ax1.plot(log_ef, recalls, 'o-', linewidth=2.5, markersize=10, 
+                     color=color1, label='Recall@10', rasterized=True)
     ax1.tick_params(axis='y', labelcolor=color1)
     ax1.set_ylim(80, 101)
-    ax1.set_xscale('log', base=2)
+    ax1.set_xticks(log_ef)
+    ax1.set_xticklabels([str(ef) for ef in ef_values])
     
     # Latency curve (right y-axis)
     ax2 = ax1.twinx()
     color2 = '#dc2626'
     ax2.set_ylabel('Latency P50 (ms)', fontsize=14, fontweight='bold', color=color2)
-    line2 = ax2.plot(ef_values, latencies, 's--', linewidth=2.5, markersize=10, 
-                     color=color2, label='Latency P50')
+    line2 = ax2.plot(log_ef, latencies, 's--', linewidth=2.5, markersize=10, 
+                     color=color2, label='Latency P50', rasterized=True)
     ax2.tick_params(axis='y', labelcolor=color2)
     
     # Combined legend
@@ -225,13 +288,14 @@ def create_ef_scaling_chart(results: List[BenchmarkResult], filename: str):
              fontsize=11, ha='center', style='italic', 
              bbox=dict(boxstyle='round', facecolor='#f0f9ff', edgecolor='#2563eb'))
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.tight_layout(rect=_INSIGHT_RECT)
+    fig.savefig(filename, dpi=DPI, facecolor='white',
+                pil_kwargs=_PNG_OPTIONS)
     print(f"✅ Scaling chart saved: {filename}")
 
 if __name__ == "__main__":
     import os
+    from concurrent.futures import ProcessPoolExecutor
     
     output_dir = os.path.dirname(os.path.abspath(__file__))
     charts_dir = os.path.join(output_dir, "..", "docs", "benchmarks")
@@ -239,28 +303,32 @@ if __name__ == "__main__":
     
     print("🎨 Generating VelesDB benchmark visualizations...\n")
     
-    # Generate charts
-    create_recall_latency_chart(
-        RESULTS_10K_128D, 
-        "VelesDB Core - Recall vs Latency (10K/128D)",
-        os.path.join(charts_dir, "recall_latency_10k_128d.png")
-    )
-    
-    create_ef_scaling_chart(
-        RESULTS_10K_128D,
-        os.path.join(charts_dir, "ef_scaling_10k_128d.png")
-    )
-    
-    create_comparison_chart(
-        RESULTS_10K_128D,
-        RESULTS_100K_768D,
-        os.path.join(charts_dir, "recall_comparison.png")
-    )
-    
-    create_native_hnsw_comparison(
-        NATIVE_VS_HNSW_RS,
-        os.path.join(charts_dir, "native_hnsw_comparison.png")
-    )
+    # Each chart is rendered in its own process: Agg rasterization is
+    # CPU-bound and holds the GIL, so threads would serialize on it.
+    charts = [
+        (create_recall_latency_chart, (
+            RESULTS_10K_128D,
+            "VelesDB Core - Recall vs Latency (10K/128D)",
+            os.path.join(charts_dir, "recall_latency_10k_128d.png"),
+        )),
+        (create_ef_scaling_chart, (
+            RESULTS_10K_128D,
+            os.path.join(charts_dir, "ef_scaling_10k_128d.png"),
+        )),
+        (create_comparison_chart, (
+            RESULTS_10K_128D,
+            RESULTS_100K_768D,
+            os.path.join(charts_dir, "recall_comparison.png"),
+        )),
+        (create_native_hnsw_comparison, (
+            NATIVE_VS_HNSW_RS,
+            os.path.join(charts_dir, "native_hnsw_comparison.png"),
+        )),
+    ]
+    with ProcessPoolExecutor(max_workers=len(charts)) as pool:
+        futures = [pool.submit(func, *args) for func, args in charts]
+        for future in futures:
+            future.result()
     
     print("\n✅ All charts generated successfully!")
     print(f"📁 Output directory: {charts_dir}")
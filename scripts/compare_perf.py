@@ -7,19 +7,63 @@ EPIC-026/US-002: Performance regression detection for CI.
 Usage:
     python compare_perf.py --current results/latest.json --baseline benchmarks/baseline.json
     python compare_perf.py --current results/latest.json --baseline benchmarks/baseline.json --threshold 15
+    python compare_perf.py --current results/latest.json --baseline benchmarks/baseline.json --fail-fast
 """
 
+import functools
 import json
 import sys
 import argparse
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
 
+# orjson parses several times faster when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is unchanged.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# NumPy vectorizes the comparison over large suites; plain lists are used
+# on runners without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ijson streams the baseline one benchmark at a time, so raw samples or
+# histograms stored next to the means never sit in memory all at once.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors raised for malformed JSON by whichever parser is in use
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+# Baseline fields the comparison reads; everything else is dropped on load
+_BASELINE_FIELDS = ("mean_ns", "mean_us", "threshold_percent")
+
 
 def load_json(path: Path) -> Dict[str, Any]:
     """Load JSON file."""
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return _json_loads(path.read_bytes())
+
+
+def _baseline_fields(benchmark: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: benchmark[key] for key in _BASELINE_FIELDS if key in benchmark}
+
+
+def load_baseline_benchmarks(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the baseline benchmarks, keeping only the fields compared."""
+    if ijson is None:
+        benchmarks = load_json(path).get("benchmarks", {})
+        return {name: _baseline_fields(b) for name, b in benchmarks.items()}
+    with open(path, "rb") as f:
+        return {
+            name: _baseline_fields(b)
+            for name, b in ijson.kvitems(f, "benchmarks", use_float=True)
+        }
 
 
 def get_mean_ns(benchmark: Dict[str, Any]) -> float:
@@ -31,35 +75,36 @@ def get_mean_ns(benchmark: Dict[str, Any]) -> float:
     raise ValueError(f"No mean time found in benchmark: {benchmark}")
 
 
-def compare_benchmark(
-    name: str,
-    current: Dict[str, Any],
-    baseline: Dict[str, Any],
-    default_threshold: float,
-) -> Tuple[str, float, bool]:
+def compare_all(
+    current_ns: List[float],
+    baseline_ns: List[float],
+    thresholds: List[float],
+) -> Tuple[Any, Any, Any]:
     """
-    Compare a single benchmark against baseline.
+    Compare every benchmark against its baseline in one pass.
     
     Returns:
-        (status, diff_percent, is_regression)
+        (diff_percents, is_regression, is_improvement), index-aligned with
+        the inputs; NumPy arrays when NumPy is installed, lists otherwise.
     """
-    current_ns = get_mean_ns(current)
-    baseline_ns = get_mean_ns(baseline)
-    
-    threshold = baseline.get("threshold_percent", default_threshold)
-    
-    diff_percent = ((current_ns - baseline_ns) / baseline_ns) * 100
-    
-    if diff_percent > threshold:
-        return ("REGRESSION", diff_percent, True)
-    elif diff_percent < -threshold:
-        return ("IMPROVEMENT", diff_percent, False)
-    else:
-        return ("STABLE", diff_percent, False)
+    if np is not None:
+        current = np.asarray(current_ns, dtype=np.float64)
+        baseline = np.asarray(baseline_ns, dtype=np.float64)
+        limit = np.asarray(thresholds, dtype=np.float64)
+        diffs = (current - baseline) / baseline * 100.0
+        return diffs, diffs > limit, diffs < -limit
+
+    diffs = [(c - b) / b * 100.0 for c, b in zip(current_ns, baseline_ns)]
+    return (
+        diffs,
+        [d > t for d, t in zip(diffs, thresholds)],
+        [d < -t for d, t in zip(diffs, thresholds)],
+    )
 
 
+@functools.lru_cache(maxsize=4096)
 def format_time(ns: float) -> str:
-    """Format nanoseconds to human-readable string."""
+    """Format nanoseconds to human-readable string (memoized; timings repeat)."""
     if ns >= 1_000_000_000:
         return f"{ns / 1_000_000_000:.2f} s"
     elif ns >= 1_000_000:
@@ -97,22 +142,26 @@ def main():
         type=Path,
         help="Optional: write comparison report to file",
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop the report at the first regression",
+    )
     args = parser.parse_args()
 
     # Load data
     try:
         current_data = load_json(args.current)
-        baseline_data = load_json(args.baseline)
+        baseline_benchmarks = load_baseline_benchmarks(args.baseline)
     except FileNotFoundError as e:
         print(f"❌ File not found: {e.filename}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         print(f"❌ Invalid JSON: {e}")
         sys.exit(1)
 
     # Get benchmarks
     current_benchmarks = current_data.get("benchmarks", {})
-    baseline_benchmarks = baseline_data.get("benchmarks", {})
 
     if not current_benchmarks:
         print("⚠️ No benchmarks found in current results")
@@ -126,38 +175,44 @@ def main():
     print(f"  Baseline: {args.baseline}")
     print(f"  Default threshold: ±{args.threshold}%\n")
 
-    results: List[Tuple[str, str, float, bool]] = []
-    regressions = 0
+    names = sorted(current_benchmarks.keys())
+    compared = [name for name in names if name in baseline_benchmarks]
+    current_ns = [get_mean_ns(current_benchmarks[name]) for name in compared]
+    baseline_ns = [get_mean_ns(baseline_benchmarks[name]) for name in compared]
+    thresholds = [
+        float(baseline_benchmarks[name].get("threshold_percent", args.threshold))
+        for name in compared
+    ]
+
+    diffs, is_regression, is_improvement = compare_all(
+        current_ns, baseline_ns, thresholds
+    )
+    regressions = int(sum(is_regression))
+    index = {name: i for i, name in enumerate(compared)}
 
-    for name in sorted(current_benchmarks.keys()):
-        if name not in baseline_benchmarks:
+    for name in names:
+        if name not in index:
             print(f"  ⚪ {name}: No baseline (skipped)")
             continue
 
-        current = current_benchmarks[name]
-        baseline = baseline_benchmarks[name]
-
-        status, diff, is_regression = compare_benchmark(
-            name, current, baseline, args.threshold
-        )
-
-        results.append((name, status, diff, is_regression))
-
-        if is_regression:
-            regressions += 1
-
-        # Format output
-        current_ns = get_mean_ns(current)
-        baseline_ns = get_mean_ns(baseline)
-
-        icon = "🔴" if is_regression else ("🟢" if status == "IMPROVEMENT" else "⚪")
+        i = index[name]
+        if is_regression[i]:
+            icon, status = "🔴", "REGRESSION"
+        elif is_improvement[i]:
+            icon, status = "🟢", "IMPROVEMENT"
+        else:
+            icon, status = "⚪", "STABLE"
         
         print(f"  {icon} {name}")
-        print(f"      Current:  {format_time(current_ns)}")
-        print(f"      Baseline: {format_time(baseline_ns)}")
-        print(f"      Change:   {diff:+.1f}% ({status})")
+        print(f"      Current:  {format_time(current_ns[i])}")
+        print(f"      Baseline: {format_time(baseline_ns[i])}")
+        print(f"      Change:   {diffs[i]:+.1f}% ({status})")
         print()
 
+        if args.fail_fast and is_regression[i]:
+            print("  ⏹️  --fail-fast: remaining benchmarks not reported\n")
+            break
+
     # Summary
     print("═" * 70)
     if regressions > 0: